@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Precompute the sample-meeting embeddings used by test_search_engine.py
+
+The search tests index the same sample meetings on every run. With the
+embeddings saved next to the tests, the session fixture memory-maps the
+matrix and hands it to MeetingSearchEngine.add_meetings, so the encoder only
+runs for queries.
+
+Usage:
+    python backend/scripts/build_test_fixture.py --tests-dir backend/tests
+    python backend/scripts/build_test_fixture.py --tests-dir tests
+
+A digest of the model name and chunk texts is saved next to the matrix; the
+fixture re-encodes instead of using a matrix whose digest no longer matches,
+so rebuild after changing create_sample_meetings or the search model.
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+import tempfile
+
+BACKEND_SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tests-dir", default="backend/tests", help="Directory containing test_search_engine.py")
+    args = parser.parse_args()
+    
+    sys.path.insert(0, BACKEND_SRC)
+    try:
+        import numpy as np
+        from models.search import MeetingSearchEngine
+    except ImportError as e:
+        print(f"❌ Search dependencies not available: {e}")
+        return 1
+    
+    test_file = os.path.join(args.tests_dir, "test_search_engine.py")
+    spec = importlib.util.spec_from_file_location("test_search_engine", test_file)
+    test_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(test_module)
+    
+    engine = MeetingSearchEngine(index_path=tempfile.mkdtemp())
+    if engine.encoder is None:
+        print("❌ Sentence transformer not available")
+        return 1
+    
+    # Same chunking and order as add_meetings, without the duplicate-text shortcut
+    meetings = test_module.create_sample_meetings()
+    texts = []
+    for meeting in meetings:
+        texts.extend(engine._extract_searchable_content(meeting)['texts'])
+    embeddings = engine.generate_embeddings(texts)
+    
+    output = test_module.SAMPLE_EMBEDDINGS_PATH
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    np.save(output, embeddings)
+    with open(test_module.SAMPLE_DIGEST_PATH, "w") as f:
+        f.write(engine.chunk_digest(meetings) + "\n")
+    
+    print(f"✅ Saved {embeddings.shape[0]} sample embeddings to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
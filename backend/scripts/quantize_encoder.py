@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Export the search encoder to ONNX and quantize it to int8 for CPU inference
+
+Dynamic int8 quantization roughly halves the memory traffic of the encoder
+and lets ONNX Runtime use int8 dot-product instructions (AVX512-VNNI, AVX2,
+ARM64), which speeds up CPU embedding with negligible loss in retrieval
+quality.
+
+Usage:
+    pip install "sentence-transformers[onnx]"
+    python backend/scripts/quantize_encoder.py --output data/search_encoder
+
+Then start the backend with the printed SEARCH_ONNX_ENCODER path. Indexes
+built with the PyTorch encoder stay usable, but rebuilding them with the
+quantized encoder gives the most consistent scores.
+"""
+
+import argparse
+import glob
+import os
+import sys
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--model", default="all-MiniLM-L6-v2", help="Sentence transformer to export")
+    parser.add_argument("--output", default="data/search_encoder", help="Directory for the exported model")
+    parser.add_argument("--config", default="avx512_vnni", choices=["arm64", "avx2", "avx512", "avx512_vnni"],
+                        help="Target instruction set for the quantized kernels")
+    args = parser.parse_args()
+    
+    try:
+        from sentence_transformers import SentenceTransformer, export_dynamic_quantized_onnx_model
+    except ImportError as e:
+        print(f"❌ ONNX export needs sentence-transformers>=3.2 with the onnx extra: {e}")
+        return 1
+    
+    print(f"📦 Exporting {args.model} to ONNX...")
+    model = SentenceTransformer(args.model, backend="onnx")
+    model.save_pretrained(args.output)
+    
+    print(f"🗜️  Quantizing to int8 for {args.config}...")
+    export_dynamic_quantized_onnx_model(model, args.config, args.output)
+    
+    quantized = [path for path in glob.glob(os.path.join(args.output, "onnx", "*.onnx"))
+                 if "qint8" in os.path.basename(path)]
+    if not quantized:
+        print("❌ Quantized model was not written")
+        return 1
+    
+    print("✅ Quantized encoder ready. Enable it with:")
+    print(f"   export SEARCH_ONNX_ENCODER={os.path.abspath(quantized[0])}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,6 +17,7 @@ sys.path.append(os.path.dirname(__file__))
 
 from fastapi import FastAPI, File, UploadFile, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 from contextlib import asynccontextmanager
@@ -26,6 +27,17 @@ from models.asr import WhisperASR
 from models.nlp import NLPProcessor
 from session_manager import SessionManager
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class FastJSONResponse(JSONResponse):
+    """JSON response serialized with orjson, which is much faster on large analysis payloads"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
 # Pydantic models for API
 class SearchRequest(BaseModel):
     query: str
@@ -97,11 +109,8 @@ async def lifespan(app: FastAPI):
         api.routes.search_engine = search_engine
         api.routes.session_manager = session_manager
         
+        # Uvicorn only accepts requests once this handler yields, so no settle delay is needed
         print("🎉 API ready!")
-        
-        # Add a small delay to ensure everything is properly initialized
-        import time
-        time.sleep(1)
         print("✅ All components initialized and ready to serve requests!")
         
     except Exception as e:
@@ -120,7 +129,9 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # Applies to the included /api/v1 router as well; fall back to stdlib json without orjson
+    default_response_class=FastJSONResponse if orjson is not None else JSONResponse
 )
 
 # Add CORS middleware
@@ -138,7 +149,7 @@ app.add_middleware(
 )
 
 # Include API routes
-from api.routes import router as api_router
+from api.routes import router as api_router, UPLOAD_CHUNK_SIZE
 app.include_router(api_router)
 
 # Mount static files for React frontend (when using Docker)
@@ -185,8 +196,12 @@ async def upload_file(file: UploadFile = File(...)):
         # Save file temporarily
         file_path = UPLOAD_DIR / f"{uuid.uuid4()}_{file.filename}"
         with open(file_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
+            # Stream to disk in chunks instead of buffering the whole upload
+            while True:
+                chunk = await file.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                buffer.write(chunk)
         
         # Process file based on type
         file_ext = Path(file_path).suffix.lower()
@@ -74,6 +74,9 @@ nlp_processor: Optional[NLPProcessor] = None
 search_engine: Optional[MeetingSearchEngine] = None
 session_manager: Optional[SessionManager] = None
 
+# Size of each read when copying an upload to disk
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+
 def get_asr_processor() -> WhisperASR:
     """Get cached ASR processor instance"""
     global asr_processor
@@ -106,6 +109,15 @@ def get_session_manager() -> SessionManager:
         )
     return session_manager
 
+def _requested_session_id(request: Request) -> Optional[str]:
+    """Session ID sent with the request (cookie, header or query parameter), if any"""
+    session_id = request.cookies.get("session_id")
+    if not session_id:
+        session_id = request.headers.get("X-Session-ID")
+    if not session_id:
+        session_id = request.query_params.get("session_id")
+    return session_id
+
 def get_or_create_session(request: Request, session_mgr: SessionManager = Depends(get_session_manager)) -> str:
     """Get existing session ID from cookies, headers, or create new one"""
     # Debug: Print all request info
@@ -114,11 +126,7 @@ def get_or_create_session(request: Request, session_mgr: SessionManager = Depend
     print(f"   Headers: {dict(request.headers)}")
     
     # Try to get session from multiple sources
-    session_id = request.cookies.get("session_id")
-    if not session_id:
-        session_id = request.headers.get("X-Session-ID")
-    if not session_id:
-        session_id = request.query_params.get("session_id")
+    session_id = _requested_session_id(request)
     
     print(f"🔍 Session lookup - ID: {session_id[:8] if session_id else 'None'}...")
     
@@ -191,9 +199,12 @@ async def upload_file(
     try:
         # Create temporary file
         with tempfile.NamedTemporaryFile(delete=False, suffix=file_extension) as tmp_file:
-            # Read and write file content
-            content = await file.read()
-            tmp_file.write(content)
+            # Copy the upload in fixed-size chunks so large recordings are never held in memory whole
+            while True:
+                chunk = await file.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                tmp_file.write(chunk)
             tmp_path = tmp_file.name
         
         # Get or create session
@@ -241,14 +252,15 @@ async def upload_file(
                 print(f"📏 Large file detected ({file_size / 1024 / 1024:.1f}MB), processing in chunks...")
                 
                 with open(tmp_path, 'r', encoding='utf-8') as f:
-                    # Read in chunks and process
+                    # Read in chunks and join once; repeated += copies the growing transcript each time
                     chunk_size = 1024 * 1024  # 1MB chunks
-                    transcript_text = ""
+                    chunks = []
                     while True:
                         chunk = f.read(chunk_size)
                         if not chunk:
                             break
-                        transcript_text += chunk
+                        chunks.append(chunk)
+                    transcript_text = "".join(chunks)
             else:
                 # Small file, read normally
                 with open(tmp_path, 'r', encoding='utf-8') as f:
@@ -386,7 +398,8 @@ async def search_meetings(
         if not session_search:
             return {"success": True, "query": search_request.query, "total_results": 0, "results": []}
         
-        results = session_search.search(
+        # Runs off the event loop so other requests are served while the query is encoded
+        results = await session_search.search_async(
             query=search_request.query,
             top_k=search_request.top_k,
             content_types=search_request.content_types,
@@ -457,6 +470,19 @@ async def get_search_filters(
         print(f"❌ Error getting search filters: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to get filters: {str(e)}")
 
+def _get_session_search_stats(session_id: str, session_mgr: SessionManager) -> Dict[str, Any]:
+    """Search statistics for a session (the engine caches them until its index changes)"""
+    # Get or create session-specific search engine for additional stats
+    session_search = session_mgr.get_or_create_search_engine(session_id)
+    search_stats = session_search.get_search_statistics() if session_search else {
+        "total_documents": 0,
+        "content_type_distribution": {},
+        "index_size_mb": 0.0,
+        "embedding_dimension": 384,
+        "model_name": "all-MiniLM-L6-v2"
+    }
+    return search_stats
+
 @router.get("/statistics", response_model=StatisticsResponse)
 async def get_statistics(
     request: Request,
@@ -466,21 +492,16 @@ async def get_statistics(
     Get search index statistics
     """
     try:
-        # Get session ID
-        session_id = get_or_create_session(request, session_mgr)
-        
-        # Get session-specific statistics
-        session_stats = session_mgr.get_session_stats(session_id)
+        # Get session-specific statistics; a session that is not in memory is answered
+        # from its header, and only a missing or expired one goes through get_or_create_session
+        session_id = _requested_session_id(request)
+        session_stats = session_mgr.get_session_stats(session_id) if session_id else None
+        if not session_stats or "session_id" not in session_stats:
+            session_id = get_or_create_session(request, session_mgr)
+            session_stats = session_mgr.get_session_stats(session_id)
         
-        # Get or create session-specific search engine for additional stats
-        session_search = session_mgr.get_or_create_search_engine(session_id)
-        search_stats = session_search.get_search_statistics() if session_search else {
-            "total_documents": 0,
-            "content_type_distribution": {},
-            "index_size_mb": 0.0,
-            "embedding_dimension": 384,
-            "model_name": "all-MiniLM-L6-v2"
-        }
+        # Get session-specific search engine stats
+        search_stats = _get_session_search_stats(session_id, session_mgr)
         
         # Combine session and search stats
         combined_stats = {
@@ -627,6 +648,7 @@ async def get_analytics(
         from collections import defaultdict
         from datetime import datetime, timedelta
         import calendar
+        import heapq
         
         # Get session ID
         session_id = get_or_create_session(request, session_mgr)
@@ -736,10 +758,10 @@ async def get_analytics(
             })
         
         # Top participants (limit to top 10)
-        top_participants = dict(sorted(participant_counts.items(), key=lambda x: x[1], reverse=True)[:10])
+        top_participants = dict(heapq.nlargest(10, participant_counts.items(), key=lambda x: x[1]))
         
         # Recent activity (last 10 meetings)
-        recent_activity = sorted(meeting_timeline, key=lambda x: x['date'], reverse=True)[:10]
+        recent_activity = heapq.nlargest(10, meeting_timeline, key=lambda x: x['date'])
         
         # Calculate average meeting length
         avg_duration = (total_duration / duration_count) if duration_count > 0 else 0
@@ -0,0 +1,12 @@
+import sys
+
+# Placeholders for action items without an owner or due date. They live here rather than in
+# models.nlp so callers can compare against them without importing the transformer stack. Every
+# fresh item shares these exact objects, but items that went through JSON or a copy only compare
+# equal, so callers should test with ==
+UNASSIGNED = sys.intern("Unassigned")
+NO_DEADLINE = sys.intern("No deadline")
+
+# Prefix of the text summarize_text returns when the summarizer raises; shared with the
+# tests for the same reason as the placeholders above
+SUMMARY_FAILED_PREFIX = "Summarization failed: "
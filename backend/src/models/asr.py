@@ -1,22 +1,13 @@
 import whisper
 import torch
-from typing import Dict, Any, List
+import numpy as np
+from typing import Dict, Any, List, Union
 import logging
 import os
 import time
-import functools
 import threading
 
-def timing_decorator(func):
-    """Simple timing decorator"""
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        start_time = time.time()
-        result = func(*args, **kwargs)
-        end_time = time.time()
-        logging.info(f"{func.__name__} executed in {end_time - start_time:.2f} seconds")
-        return result
-    return wrapper
+from utils.performance import timing_decorator
 
 class WhisperASR:
     """Whisper-based Automatic Speech Recognition with model caching"""
@@ -69,18 +60,18 @@ class WhisperASR:
             raise
     
     @timing_decorator
-    def transcribe(self, audio_path: str, language: str = None) -> Dict[str, Any]:
+    def transcribe(self, audio_path: Union[str, np.ndarray], language: str = None) -> Dict[str, Any]:
         """
         Transcribe audio file
         
         Args:
-            audio_path: Path to audio file
+            audio_path: Path to audio file, or 16kHz mono float32 samples
             language: Force specific language (optional)
             
         Returns:
             Dict with transcription results
         """
-        if not os.path.exists(audio_path):
+        if isinstance(audio_path, str) and not os.path.exists(audio_path):
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
         
         try:
@@ -101,7 +92,8 @@ class WhisperASR:
             }
             
         except Exception as e:
-            logging.error(f"Transcription failed for {audio_path}: {e}")
+            source = audio_path if isinstance(audio_path, str) else "in-memory audio"
+            logging.error(f"Transcription failed for {source}: {e}")
             raise
     
     def transcribe_batch(self, audio_paths: List[str]) -> List[Dict[str, Any]]:
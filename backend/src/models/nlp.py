@@ -1,22 +1,119 @@
 from transformers import pipeline, AutoTokenizer, AutoModel
 import torch
-from typing import List, Dict, Any, Set
+import numpy as np
+from typing import List, Dict, Any, Optional, Set, Tuple
 import re
+import copy
+import hashlib
 import logging
+import os
 import time
-import functools
 import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
-def timing_decorator(func):
-    """Simple timing decorator"""
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        start_time = time.time()
-        result = func(*args, **kwargs)
-        end_time = time.time()
-        logging.info(f"{func.__name__} executed in {end_time - start_time:.2f} seconds")
-        return result
-    return wrapper
+from utils.performance import timing_decorator
+
+from models import NO_DEADLINE, SUMMARY_FAILED_PREFIX, UNASSIGNED
+
+# Directory with an int8 ONNX export of the summarizer (see scripts/quantize_summarizer.py);
+# needs the optional packages in requirements-onnx.txt
+ONNX_SUMMARIZER_PATH = os.environ.get("NLP_ONNX_SUMMARIZER")
+
+# Transcripts a batch analyzes concurrently; set NLP_BATCH_WORKERS=1 to analyze them one by one
+NLP_BATCH_WORKERS = max(1, int(os.environ.get("NLP_BATCH_WORKERS", min(4, os.cpu_count() or 1))))
+
+# Regex patterns used by the extractors, compiled once at import time
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
+# Action items
+_DIRECT_ASSIGNMENT_RE = re.compile(r'([A-Z][a-z]+),?\s+(can you|will you|should you|need you to)\s+(.+)')
+_FUTURE_ASSIGNMENT_RE = re.compile(r'([A-Z][a-z]+)\s+(?:will|can|should)\s+(.+)')
+_STRONG_VERB_RE = re.compile(
+    r'\b(?:prepare|create|develop|implement|fix|contact|survey|reach out|review|audit|calculate|draft|notify|schedule|coordinate)\b',
+    re.IGNORECASE
+)
+_CAPITALIZED_WORD_RE = re.compile(r'\b([A-Z][a-z]+)\b')
+
+# Deadlines (matched against lowercased text)
+_DEADLINE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'by\s+((?:next\s+)?(?:monday|tuesday|wednesday|thursday|friday|saturday|sunday))',
+    r'by\s+(end\s+of\s+(?:this\s+|next\s+)?week)',
+    r'by\s+((?:this\s+|next\s+)?(?:week|month|quarter))',
+    r'(?:due|deadline)\s+(\w+day)',
+    r'by\s+(\w+\s+\d+)',
+    r'within\s+(\d+\s+(?:hours?|days?|weeks?))',
+    r'(?:in|after)\s+(\d+\s+(?:hours?|days?|weeks?))',
+))
+
+# One scan over the union of the patterns rules out most sentences before the ordered checks
+_DEADLINE_ANY_RE = re.compile('|'.join(f'(?:{pattern.pattern})' for pattern in _DEADLINE_PATTERNS))
+
+# Key decisions
+_DECISION_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    # Explicit decision language
+    r'(?:we(?:\s+have)?|i)\s+(?:decided|agreed|concluded|resolved|determined)\s+(?:to|that)\s+(.+)',
+    
+    # Approval/rejection patterns
+    r'(?:approved|rejected|denied|accepted|endorsed)\s+(.+)',
+    
+    # Future commitment patterns
+    r'(?:we will|we\'ll|going forward|from now on|starting)\s+(.+)',
+    
+    # Vote/consensus patterns  
+    r'(?:voted to|consensus is|everyone agrees?)\s+(.+)',
+    
+    # Budget/resource allocation
+    r'(?:budget|allocated?|spending|invest)\s+(.+?)(?:approved|rejected|on)',
+    
+    # Final decision indicators
+    r'(?:final decision|bottom line|conclusion)\s+(?:is|was)?\s*(.+)',
+))
+
+# Only a yes/no answer is needed for decisions, so all patterns are scanned in one pass
+_DECISION_ANY_RE = re.compile('|'.join(f'(?:{pattern.pattern})' for pattern in _DECISION_PATTERNS), re.IGNORECASE)
+
+# Timelines: (pattern, timeline type, confidence)
+_TIMELINE_PATTERNS = tuple((re.compile(pattern, re.IGNORECASE), timeline_type, confidence) for pattern, timeline_type, confidence in (
+    # Specific date ranges
+    (r'(\d+[-–]\d+)\s+(weeks?|months?|days?)', 'duration', 0.9),
+    
+    # Approximate timeframes
+    (r'(?:probably|approximately|about|around)\s+(\d+)\s+(weeks?|months?|days?)', 'estimate', 0.8),
+    
+    # Deadline patterns
+    (r'(?:by|due|deadline|complete by)\s+(\w+day|\w+\s+\d+|\w+\s+\d+th?)', 'deadline', 0.9),
+    
+    # Phase/milestone patterns
+    (r'(?:phase|milestone|stage)\s+(\d+|one|two|three)\s+(?:will|should|expected)\s+(?:take|last|be)\s+(.+)', 'phase', 0.8),
+    
+    # Project timeline patterns
+    (r'(?:project|timeline|schedule|plan)\s+(?:will|should|expected to)\s+(?:take|last|be|complete in)\s+(.+)', 'project_timeline', 0.8),
+    
+    # Relative time patterns
+    (r'(?:in|within|after|over)\s+(?:the\s+)?(?:next\s+)?(\d+)\s+(weeks?|months?|days?|quarters?)', 'relative', 0.7),
+    
+    # Quarterly/annual patterns
+    (r'(?:q[1-4]|quarter\s+[1-4]|first|second|third|fourth)\s+quarter', 'quarterly', 0.8),
+    
+    # Start/end patterns
+    (r'(?:start|begin|launch|kick off)\s+(?:in|on|by)\s+(.+)', 'start_date', 0.7),
+    (r'(?:end|finish|complete|wrap up)\s+(?:in|on|by)\s+(.+)', 'end_date', 0.7)
+))
+
+_TIMELINE_ANY_RE = re.compile('|'.join(f'(?:{pattern.pattern})' for pattern, _, _ in _TIMELINE_PATTERNS), re.IGNORECASE)
+_GENERAL_TIME_RE = re.compile(r'(\d+)\s+(weeks?|months?|days?|quarters?)')
+
+# Keywords that mark a sentence as important when extracting key sections
+_KEY_SECTION_KEYWORDS = (
+    'decision', 'action', 'deadline', 'responsible', 'meeting', 'project',
+    'timeline', 'budget', 'strategy', 'plan', 'next steps', 'follow up',
+    'agreed', 'concluded', 'resolved', 'approved', 'assigned'
+)
+
+# Participants: "NAME:" at start of line
+_SPEAKER_RE = re.compile(r'^([A-Z][a-z]{2,}(?:\s+[A-Z][a-z]+)*):', re.MULTILINE)
 
 class NLPProcessor:
     """Natural Language Processing pipeline for meeting analysis with model caching"""
@@ -47,9 +144,16 @@ class NLPProcessor:
             
         self.device = device or ("cuda" if torch.cuda.is_available() else "cpu")
         self.summarizer = None
-        self.classifier = None
-        self.embedder = None
+        self._classifier = None  # Loaded on first use, see the classifier property
+        self._embedder = None  # Loaded on first use, see the embedder property
         self._ner_pipeline = None  # Cache for NER model
+        # Batch threads share the NER pipeline, whose fast tokenizer is not thread-safe;
+        # inference is serialized here (model loading stays under the class-level _lock)
+        self._ner_lock = threading.Lock()
+        # Transcript digest -> comprehensive summary, so re-analyzing the same transcript is free
+        self._summary_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._summary_cache_size = 64
+        self._summary_cache_lock = threading.Lock()
         
         with self._lock:
             if not self._models_loaded:
@@ -59,43 +163,80 @@ class NLPProcessor:
         self._initialized = True
     
     def setup_models(self):
-        """Initialize all NLP models (cached singleton)"""
+        """
+        Initialize the NLP models every analysis needs (cached singleton)
+        
+        Only the summarizer is loaded eagerly; the zero-shot classifier, the
+        embedder and the NER model are loaded the first time they are used.
+        """
         try:
             logging.info(f"🚀 CACHED MODEL LOADING: Loading NLP models on {self.device}")
             model_start_time = time.time()
             
             # Summarization - using T5-small for better sentence completion
             logging.info("📥 Loading summarization model...")
-            self.summarizer = pipeline(
-                "summarization",
-                model="t5-small",  
-                device=0 if self.device == "cuda" else -1,
-                torch_dtype=torch.float16 if self.device == "cuda" else torch.float32
-            )
-            
-            # Action item classification (zero-shot)
-            logging.info("Loading zero-shot classification model...")
-            self.classifier = pipeline(
-                "zero-shot-classification",
-                model="facebook/bart-large-mnli",
-                device=0 if self.device == "cuda" else -1
-            )
-            
-            # Sentence embeddings for semantic similarity
-            logging.info("Loading sentence transformer...")
-            self.embedder = pipeline(
-                "feature-extraction",
-                model="sentence-transformers/all-MiniLM-L6-v2",
-                device=0 if self.device == "cuda" else -1
-            )
+            if ONNX_SUMMARIZER_PATH and self.device == "cpu":
+                self.summarizer = self._load_onnx_summarizer()
+            if self.summarizer is None:
+                self.summarizer = pipeline(
+                    "summarization",
+                    model="t5-small",  
+                    device=0 if self.device == "cuda" else -1,
+                    torch_dtype=torch.float16 if self.device == "cuda" else torch.float32
+                )
             
             model_load_time = time.time() - model_start_time
-            logging.info(f"✅ ALL NLP MODELS CACHED in {model_load_time:.2f}s - Future requests will be instant!")
+            logging.info(f"✅ NLP MODELS CACHED in {model_load_time:.2f}s - Future requests will be instant!")
             
         except Exception as e:
             logging.error(f"Failed to load NLP models: {e}")
             raise
     
+    def _load_onnx_summarizer(self):
+        """Load the quantized ONNX summarizer for CPU, or return None to fall back to PyTorch"""
+        try:
+            import onnxruntime
+            from optimum.onnxruntime import ORTModelForSeq2SeqLM
+            
+            session_options = onnxruntime.SessionOptions()
+            session_options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+            
+            logging.info(f"📥 Loading quantized ONNX summarizer: {ONNX_SUMMARIZER_PATH}")
+            model = ORTModelForSeq2SeqLM.from_pretrained(ONNX_SUMMARIZER_PATH, session_options=session_options)
+            tokenizer = AutoTokenizer.from_pretrained(ONNX_SUMMARIZER_PATH)
+            return pipeline("summarization", model=model, tokenizer=tokenizer)
+        except Exception as e:
+            logging.warning(f"Quantized ONNX summarizer unavailable, using PyTorch: {e}")
+            return None
+    
+    @property
+    def classifier(self):
+        """Zero-shot classifier for extract_action_items (loaded on first use) - thread-safe"""
+        if self._classifier is None:
+            with self._lock:
+                if self._classifier is None:
+                    logging.info("Loading zero-shot classification model...")
+                    self._classifier = pipeline(
+                        "zero-shot-classification",
+                        model="facebook/bart-large-mnli",
+                        device=0 if self.device == "cuda" else -1
+                    )
+        return self._classifier
+    
+    @property
+    def embedder(self):
+        """Sentence embedding pipeline for semantic similarity (loaded on first use) - thread-safe"""
+        if self._embedder is None:
+            with self._lock:
+                if self._embedder is None:
+                    logging.info("Loading sentence transformer...")
+                    self._embedder = pipeline(
+                        "feature-extraction",
+                        model="sentence-transformers/all-MiniLM-L6-v2",
+                        device=0 if self.device == "cuda" else -1
+                    )
+        return self._embedder
+    
     @timing_decorator
     def summarize_text(self, text: str, max_length: int = 150, min_length: int = 30) -> str:
         """
@@ -176,7 +317,7 @@ class NLPProcessor:
             
         except Exception as e:
             logging.error(f"Summarization failed: {e}")
-            return f"Summarization failed: {str(e)}"
+            return f"{SUMMARY_FAILED_PREFIX}{str(e)}"
     
     @timing_decorator
     def extract_action_items(self, text: str, confidence_threshold: float = 0.5) -> List[Dict[str, Any]]:
@@ -254,7 +395,7 @@ class NLPProcessor:
         """
         try:
             # Clean and tokenize text
-            text_clean = re.sub(r'[^\w\s]', ' ', text.lower())
+            text_clean = _NON_WORD_RE.sub(' ', text.lower())
             words = text_clean.split()
             
             # Filter out common words and short words
@@ -404,78 +545,174 @@ class NLPProcessor:
     def _extract_key_sections(self, text: str, target_length: int = 4000) -> str:
         """Extract most important sections from large text"""
         sentences = self._split_sentences(text)
+        num_sentences = len(sentences)
         
-        # Score sentences by keyword density and position
-        scored_sentences = []
-        important_keywords = [
-            'decision', 'action', 'deadline', 'responsible', 'meeting', 'project',
-            'timeline', 'budget', 'strategy', 'plan', 'next steps', 'follow up',
-            'agreed', 'concluded', 'resolved', 'approved', 'assigned'
-        ]
+        # Score sentences by keyword density and position, as whole arrays
+        lengths = np.fromiter((len(sentence) for sentence in sentences), dtype=np.int64, count=num_sentences)
+        sentences_lower = [sentence.lower() for sentence in sentences]  # Once per sentence, not per keyword
+        keyword_hits = np.fromiter(
+            (sum(keyword in sentence for keyword in _KEY_SECTION_KEYWORDS) for sentence in sentences_lower),
+            dtype=np.int64,
+            count=num_sentences
+        )
+        positions = np.arange(num_sentences)
         
-        for i, sentence in enumerate(sentences):
-            score = 0
-            sentence_lower = sentence.lower()
-            
-            # Keyword scoring
-            for keyword in important_keywords:
-                if keyword in sentence_lower:
-                    score += 2
-            
-            # Position scoring (beginning and end are often important)
-            if i < len(sentences) * 0.2:  # First 20%
-                score += 1
-            elif i > len(sentences) * 0.8:  # Last 20%
-                score += 1
-                
+        scores = (
+            2 * keyword_hits
+            # Position scoring (first and last 20% are often important)
+            + ((positions < num_sentences * 0.2) | (positions > num_sentences * 0.8))
             # Length scoring (not too short, not too long)
-            if 50 < len(sentence) < 200:
-                score += 1
-                
-            scored_sentences.append((sentence, score))
+            + ((lengths > 50) & (lengths < 200))
+        )
         
-        # Sort by score and take top sentences
-        scored_sentences.sort(key=lambda x: x[1], reverse=True)
-        
-        # Select sentences until target length
-        selected = []
-        current_length = 0
-        
-        for sentence, score in scored_sentences:
-            if current_length + len(sentence) <= target_length:
-                selected.append(sentence)
-                current_length += len(sentence)
-            else:
-                break
+        # Rank by score (stable, so ties keep transcript order) and take the
+        # longest prefix of the ranking that fits in the target length
+        order = np.argsort(-scores, kind='stable')
+        cumulative_length = np.cumsum(lengths[order])
+        num_selected = int(np.searchsorted(cumulative_length, target_length, side='right'))
+        selected = [sentences[i] for i in order[:num_selected]]
         
         return ". ".join(selected) + "."
     
     def _split_sentences(self, text: str) -> List[str]:
         """Split text into sentences"""
         # Simple sentence splitting
-        sentences = re.split(r'[.!?]+', text)
+        sentences = _SENTENCE_SPLIT_RE.split(text)
         return [s.strip() for s in sentences if s.strip()]
     
     def generate_comprehensive_summary(self, text: str) -> Dict[str, Any]:
         """
         Generate a comprehensive meeting summary with structured components
         
+        Results are memoized per transcript (keyed on a BLAKE2s digest of the text);
+        callers always receive their own copy.
+        
         Returns:
             Dict with summary, action_items, key_decisions, timelines, and participants
         """
+        cache_key = self._summary_cache_key(text)
+        cached = self._get_cached_summary(cache_key)
+        if cached is not None:
+            return cached
+        
+        return self._analyze_transcript(text, cache_key)
+    
+    def generate_comprehensive_summary_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Generate comprehensive summaries for several transcripts at once
+        
+        Transcripts that take a single-pass summarization route share one batched
+        summarizer call; the extraction then runs per transcript, up to
+        NLP_BATCH_WORKERS transcripts at a time. Memoization is shared with
+        generate_comprehensive_summary.
+        
+        Returns:
+            One result dict per input text, in the same order
+        """
+        cache_keys = [self._summary_cache_key(text) for text in texts]
+        results = [self._get_cached_summary(key) for key in cache_keys]
+        
+        # Analyze each uncached transcript once, even if it is repeated in the batch
+        pending: Dict[str, str] = {}
+        for key, text, result in zip(cache_keys, texts, results):
+            if result is None:
+                pending.setdefault(key, text)
+        
+        summaries = self._summarize_batch(list(pending.values()), max_length=100, min_length=30)
+        jobs = [(text, key, summary) for (key, text), summary in zip(pending.items(), summaries)]
+        
+        # NER inference runs in torch without the GIL, so transcripts overlap well on threads;
+        # threads also share the loaded models instead of copying them into worker processes
+        workers = min(NLP_BATCH_WORKERS, len(jobs))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                outputs = list(executor.map(lambda job: self._analyze_transcript(*job), jobs))
+        else:
+            outputs = [self._analyze_transcript(*job) for job in jobs]
+        analyzed = {key: output for (_, key, _), output in zip(jobs, outputs)}
+        
+        return [
+            result if result is not None else copy.deepcopy(analyzed[key])
+            for key, result in zip(cache_keys, results)
+        ]
+    
+    def _summarize_batch(self, texts: List[str], max_length: int = 150, min_length: int = 30) -> List[str]:
+        """
+        Summarize several texts, batching the ones summarize_text handles in one call
+        
+        Short texts and key-section extracts of long texts go through the summarizer
+        together; medium texts (multi-chunk route) fall back to summarize_text.
+        """
+        summaries: List[Optional[str]] = [None] * len(texts)
+        batch_inputs = []
+        batch_positions = []
+        
+        for i, text in enumerate(texts):
+            if not text or len(text.strip()) < 50:
+                summaries[i] = "Text too short to summarize"
+            elif len(text) <= 2000:
+                batch_inputs.append(text)
+                batch_positions.append(i)
+            elif len(text) > 8000:
+                batch_inputs.append(self._extract_key_sections(text, target_length=4000))
+                batch_positions.append(i)
+        
+        if batch_inputs:
+            print(f"📝 Batched summarization for {len(batch_inputs)} texts")
+            try:
+                outputs = self.summarizer(
+                    batch_inputs,
+                    max_new_tokens=max_length,
+                    min_length=min_length,
+                    do_sample=False,
+                    truncation=True,
+                    clean_up_tokenization_spaces=True,
+                    batch_size=len(batch_inputs)
+                )
+                for i, output in zip(batch_positions, outputs):
+                    if isinstance(output, list):
+                        output = output[0]
+                    summaries[i] = output['summary_text'].strip()
+            except Exception as e:
+                logging.error(f"Batched summarization failed, summarizing individually: {e}")
+        
+        return [
+            summary if summary is not None else self.summarize_text(text, max_length=max_length, min_length=min_length)
+            for text, summary in zip(texts, summaries)
+        ]
+    
+    def _analyze_transcript(self, text: str, cache_key: str, basic_summary: Optional[str] = None) -> Dict[str, Any]:
+        """Run the extraction pipeline for one transcript and cache the result"""
         try:
-            # Basic summary with optimization
-            basic_summary = self.summarize_text(text, max_length=100, min_length=30)
-            
-            # Enhanced action items with better detection
-            action_items = self.extract_enhanced_action_items(text)
-            
-            # Extract key decisions and timelines
-            decisions = self.extract_key_decisions(text)
-            timelines = self.extract_timelines(text)
-            participants = self.extract_participants(text)
+            # The summarizer releases the GIL inside torch, so a summary still to be made runs
+            # in the background. NER and the regex extractors stay on this thread; batch
+            # callers already analyze transcripts on their own threads
+            executor = None
+            summary_future = None
+            if basic_summary is None:
+                executor = ThreadPoolExecutor(max_workers=1)
+                summary_future = executor.submit(self.summarize_text, text, max_length=100, min_length=30)
+            try:
+                participants, ner_succeeded = self._extract_participants(text)
+                
+                # Split and lowercase once, and share both views between all extractors
+                sentences = self._split_sentences(text)
+                lowered = [sentence.lower() for sentence in sentences]
+                
+                # Enhanced action items with better detection
+                action_items = self.extract_enhanced_action_items(text, sentences=sentences, lowered=lowered)
+                
+                # Extract key decisions and timelines
+                decisions = self.extract_key_decisions(text, sentences=sentences, lowered=lowered)
+                timelines = self.extract_timelines(text, sentences=sentences, lowered=lowered)
+                
+                if summary_future is not None:
+                    basic_summary = summary_future.result()
+            finally:
+                if executor is not None:
+                    executor.shutdown()
             
-            return {
+            result = {
                 "summary": basic_summary,
                 "action_items": action_items,
                 "key_decisions": decisions,
@@ -484,6 +721,16 @@ class NLPProcessor:
                 "topics": self.extract_key_topics(text)
             }
             
+            # Only successful results are cached; a summarizer error (returned as text by
+            # summarize_text), regex-fallback participants and the fallback below are
+            # retried on the next call
+            if ner_succeeded and not basic_summary.startswith(SUMMARY_FAILED_PREFIX):
+                with self._summary_cache_lock:
+                    self._summary_cache[cache_key] = copy.deepcopy(result)
+                    while len(self._summary_cache) > self._summary_cache_size:
+                        self._summary_cache.popitem(last=False)
+            return result
+            
         except Exception as e:
             logging.error(f"Comprehensive summary generation failed: {e}")
             return {
@@ -495,63 +742,79 @@ class NLPProcessor:
                 "topics": self.extract_key_topics(text)
             }
     
-    def extract_enhanced_action_items(self, text: str) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _summary_cache_key(text: str) -> str:
+        """Digest identifying a transcript in the summary cache"""
+        return hashlib.blake2s(text.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
+    
+    def _get_cached_summary(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of a memoized comprehensive summary, or None"""
+        with self._summary_cache_lock:
+            cached = self._summary_cache.get(cache_key)
+            if cached is None:
+                return None
+            self._summary_cache.move_to_end(cache_key)
+            return copy.deepcopy(cached)
+    
+    def extract_enhanced_action_items(self, text: str, sentences: Optional[List[str]] = None,
+                                      lowered: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """Enhanced action item extraction with better pattern recognition"""
-        import re
-        sentences = self._split_sentences(text)
+        if sentences is None:
+            sentences = self._split_sentences(text)
+        if lowered is None:
+            lowered = [sentence.lower() for sentence in sentences]
         action_items = []
         
-        for sentence in sentences:
+        for sentence, sentence_lower in zip(sentences, lowered):
             sentence = sentence.strip()
             if len(sentence) < 10:
                 continue
             
             # Pattern 1: Direct assignments "Name, can you/will you..."
-            direct_assignment = re.search(r'([A-Z][a-z]+),?\s+(can you|will you|should you|need you to)\s+(.+)', sentence)
+            direct_assignment = _DIRECT_ASSIGNMENT_RE.search(sentence)
             if direct_assignment:
                 assignee = direct_assignment.group(1)
                 task = direct_assignment.group(3)
-                deadline = self._extract_deadline(sentence)
+                deadline = self._extract_deadline(sentence, sentence_lower)
                 
                 action_items.append({
                     "text": sentence,
                     "assignee": assignee,
                     "deadline": deadline,
-                    "category": self._categorize_action_item(sentence),
+                    "category": self._categorize_action_item(sentence, sentence_lower),
                     "confidence": 0.9
                 })
                 continue
             
             # Pattern 2: Future tense with names "Name will..."
-            future_pattern = re.search(r'([A-Z][a-z]+)\s+(?:will|can|should)\s+(.+)', sentence)
+            future_pattern = _FUTURE_ASSIGNMENT_RE.search(sentence)
             if future_pattern:
                 assignee = future_pattern.group(1)
-                deadline = self._extract_deadline(sentence)
+                deadline = self._extract_deadline(sentence, sentence_lower)
                 
                 action_items.append({
                     "text": sentence,
                     "assignee": assignee,  
                     "deadline": deadline,
-                    "category": self._categorize_action_item(sentence),
+                    "category": self._categorize_action_item(sentence, sentence_lower),
                     "confidence": 0.8
                 })
                 continue
             
             # Pattern 3: Implicit actions with strong verbs
-            strong_verbs = r'\b(?:prepare|create|develop|implement|fix|contact|survey|reach out|review|audit|calculate|draft|notify|schedule|coordinate)\b'
-            if re.search(strong_verbs, sentence, re.IGNORECASE):
+            if _STRONG_VERB_RE.search(sentence):
                 # Try to find associated name in context
-                name_match = re.search(r'\b([A-Z][a-z]+)\b', sentence)
-                assignee = name_match.group(1) if name_match else "Unassigned"
-                deadline = self._extract_deadline(sentence)
+                name_match = _CAPITALIZED_WORD_RE.search(sentence)
+                assignee = name_match.group(1) if name_match else UNASSIGNED
+                deadline = self._extract_deadline(sentence, sentence_lower)
                 
                 # Only add if it sounds like an action
-                if any(word in sentence.lower() for word in ['need', 'should', 'have to', 'must', 'by', 'due']):
+                if any(word in sentence_lower for word in ['need', 'should', 'have to', 'must', 'by', 'due']):
                     action_items.append({
                         "text": sentence,
                         "assignee": assignee,
                         "deadline": deadline,
-                        "category": self._categorize_action_item(sentence),
+                        "category": self._categorize_action_item(sentence, sentence_lower),
                         "confidence": 0.7
                     })
         
@@ -565,53 +828,27 @@ class NLPProcessor:
         
         return unique_items
     
-    def _extract_deadline(self, text: str) -> str:
+    def _extract_deadline(self, text: str, text_lower: Optional[str] = None) -> str:
         """Extract deadline information from text"""
-        import re
-        
-        deadline_patterns = [
-            r'by\s+((?:next\s+)?(?:monday|tuesday|wednesday|thursday|friday|saturday|sunday))',
-            r'by\s+(end\s+of\s+(?:this\s+|next\s+)?week)',
-            r'by\s+((?:this\s+|next\s+)?(?:week|month|quarter))',
-            r'(?:due|deadline)\s+(\w+day)',
-            r'by\s+(\w+\s+\d+)',
-            r'within\s+(\d+\s+(?:hours?|days?|weeks?))',
-            r'(?:in|after)\s+(\d+\s+(?:hours?|days?|weeks?))',
-        ]
+        if text_lower is None:
+            text_lower = text.lower()
+        
+        if not _DEADLINE_ANY_RE.search(text_lower):
+            return NO_DEADLINE
         
-        for pattern in deadline_patterns:
-            match = re.search(pattern, text.lower())
+        for pattern in _DEADLINE_PATTERNS:
+            match = pattern.search(text_lower)
             if match:
                 return match.group(1)
         
-        return "No deadline"
+        return NO_DEADLINE
     
-    def extract_key_decisions(self, text: str) -> List[str]:
+    def extract_key_decisions(self, text: str, sentences: Optional[List[str]] = None,
+                              lowered: Optional[List[str]] = None) -> List[str]:
         """Extract key decisions made in the meeting"""
-        import re
         decisions = []
-        sentences = self._split_sentences(text)
-        
-        # Enhanced decision patterns
-        decision_patterns = [
-            # Explicit decision language
-            r'(?:we(?:\s+have)?|i)\s+(?:decided|agreed|concluded|resolved|determined)\s+(?:to|that)\s+(.+)',
-            
-            # Approval/rejection patterns
-            r'(?:approved|rejected|denied|accepted|endorsed)\s+(.+)',
-            
-            # Future commitment patterns
-            r'(?:we will|we\'ll|going forward|from now on|starting)\s+(.+)',
-            
-            # Vote/consensus patterns  
-            r'(?:voted to|consensus is|everyone agrees?)\s+(.+)',
-            
-            # Budget/resource allocation
-            r'(?:budget|allocated?|spending|invest)\s+(.+?)(?:approved|rejected|on)',
-            
-            # Final decision indicators
-            r'(?:final decision|bottom line|conclusion)\s+(?:is|was)?\s*(.+)',
-        ]
+        if sentences is None:
+            sentences = self._split_sentences(text)
         
         for sentence in sentences:
             sentence = sentence.strip()
@@ -619,10 +856,8 @@ class NLPProcessor:
                 continue
                 
             # Check for pattern matches
-            for pattern in decision_patterns:
-                if re.search(pattern, sentence, re.IGNORECASE):
-                    decisions.append(sentence)
-                    break  # Only match first pattern per sentence
+            if _DECISION_ANY_RE.search(sentence):
+                decisions.append(sentence)
         
         # Also look for sentences with strong decision indicators
         decision_indicators = [
@@ -631,11 +866,13 @@ class NLPProcessor:
             "rejected", "denied", "voted", "consensus", "concluded"
         ]
         
-        for sentence in sentences:
+        if lowered is None:
+            lowered = [sentence.lower() for sentence in sentences]
+        
+        for sentence, sentence_lower in zip(sentences, lowered):
             if len(sentence) < 20:
                 continue
                 
-            sentence_lower = sentence.lower()
             if any(indicator in sentence_lower for indicator in decision_indicators):
                 # Check if we haven't already captured this decision
                 if sentence not in decisions:
@@ -643,47 +880,20 @@ class NLPProcessor:
         
         return decisions[:8]  # Return top 8 decisions
     
-    def extract_timelines(self, text: str) -> List[Dict[str, str]]:
+    def extract_timelines(self, text: str, sentences: Optional[List[str]] = None,
+                          lowered: Optional[List[str]] = None) -> List[Dict[str, str]]:
         """Extract timeline information with enhanced pattern recognition"""
-        import re
         timelines = []
-        sentences = self._split_sentences(text)
-        
-        # Enhanced timeline patterns
-        timeline_patterns = [
-            # Specific date ranges
-            (r'(\d+[-–]\d+)\s+(weeks?|months?|days?)', 'duration', 0.9),
-            
-            # Approximate timeframes
-            (r'(?:probably|approximately|about|around)\s+(\d+)\s+(weeks?|months?|days?)', 'estimate', 0.8),
-            
-            # Deadline patterns
-            (r'(?:by|due|deadline|complete by)\s+(\w+day|\w+\s+\d+|\w+\s+\d+th?)', 'deadline', 0.9),
-            
-            # Phase/milestone patterns
-            (r'(?:phase|milestone|stage)\s+(\d+|one|two|three)\s+(?:will|should|expected)\s+(?:take|last|be)\s+(.+)', 'phase', 0.8),
-            
-            # Project timeline patterns
-            (r'(?:project|timeline|schedule|plan)\s+(?:will|should|expected to)\s+(?:take|last|be|complete in)\s+(.+)', 'project_timeline', 0.8),
-            
-            # Relative time patterns
-            (r'(?:in|within|after|over)\s+(?:the\s+)?(?:next\s+)?(\d+)\s+(weeks?|months?|days?|quarters?)', 'relative', 0.7),
-            
-            # Quarterly/annual patterns
-            (r'(?:q[1-4]|quarter\s+[1-4]|first|second|third|fourth)\s+quarter', 'quarterly', 0.8),
-            
-            # Start/end patterns
-            (r'(?:start|begin|launch|kick off)\s+(?:in|on|by)\s+(.+)', 'start_date', 0.7),
-            (r'(?:end|finish|complete|wrap up)\s+(?:in|on|by)\s+(.+)', 'end_date', 0.7)
-        ]
+        if sentences is None:
+            sentences = self._split_sentences(text)
         
         for sentence in sentences:
             sentence = sentence.strip()
-            if len(sentence) < 10:
+            if len(sentence) < 10 or not _TIMELINE_ANY_RE.search(sentence):
                 continue
                 
-            for pattern, timeline_type, confidence in timeline_patterns:
-                match = re.search(pattern, sentence, re.IGNORECASE)
+            for pattern, timeline_type, confidence in _TIMELINE_PATTERNS:
+                match = pattern.search(sentence)
                 if match:
                     if len(match.groups()) >= 2:
                         timeline_text = f"{match.group(1)} {match.group(2)}"
@@ -701,16 +911,18 @@ class NLPProcessor:
         # Also look for general time-related sentences
         time_keywords = ['weeks', 'months', 'days', 'timeline', 'schedule', 'deadline', 'due', 'by', 'quarter', 'year']
         
-        for sentence in sentences:
+        if lowered is None:
+            lowered = [sentence.lower() for sentence in sentences]
+        
+        for sentence, sentence_lower in zip(sentences, lowered):
             if len(sentence) < 15:
                 continue
                 
-            sentence_lower = sentence.lower()
             if any(keyword in sentence_lower for keyword in time_keywords):
                 # Check if we haven't already captured this timeline
                 if not any(sentence in t['context'] for t in timelines):
                     # Extract potential time information
-                    time_match = re.search(r'(\d+)\s+(weeks?|months?|days?|quarters?)', sentence_lower)
+                    time_match = _GENERAL_TIME_RE.search(sentence_lower)
                     if time_match:
                         timelines.append({
                             "timeline": time_match.group(0),
@@ -735,19 +947,24 @@ class NLPProcessor:
     
     def extract_participants(self, text: str) -> List[str]:
         """Extract meeting participants using NER (Named Entity Recognition)"""
+        participants, _ = self._extract_participants(text)
+        return participants
+    
+    def _extract_participants(self, text: str) -> Tuple[List[str], bool]:
+        """Extract participants, also reporting whether NER succeeded (False means regex fallback)"""
         print("🤖 Running NER for participant extraction...")
         
         try:
             participants = self._extract_participants_with_ner(text)
-            final_list = sorted(list(participants))[:10]
+            final_list = sorted(participants)[:10]
             
             print(f"✅ NER extracted {len(final_list)} participants: {final_list}")
-            return final_list
+            return final_list, True
             
         except Exception as e:
             print(f"❌ NER extraction failed: {e}")
             print("💡 Falling back to regex extraction...")
-            return self._extract_participants_regex_fallback(text)
+            return self._extract_participants_regex_fallback(text), False
     
     def _extract_participants_with_ner(self, text: str) -> Set[str]:
         """Extract participants using HuggingFace NER model"""
@@ -771,7 +988,8 @@ class NLPProcessor:
             participants = set()
             
             for chunk in chunks:
-                entities = self._ner_pipeline(chunk)
+                with self._ner_lock:
+                    entities = self._ner_pipeline(chunk)
                 
                 for entity in entities:
                     if entity['entity_group'] == 'PER' and entity['score'] > 0.85:
@@ -809,23 +1027,18 @@ class NLPProcessor:
     
     def _extract_participants_regex_fallback(self, text: str) -> List[str]:
         """Fallback regex-based participant extraction"""
-        import re
-        participants = set()
-        
-        # Speaker pattern: "NAME:" at start of line
-        speaker_pattern = r'^([A-Z][a-z]{2,}(?:\s+[A-Z][a-z]+)*):'
-        speakers = re.findall(speaker_pattern, text, re.MULTILINE)
-        participants.update(speakers)
+        # Speaker pattern: "NAME:" at start of line, deduplicated as it is collected
+        participants = set(_SPEAKER_RE.findall(text))
         
         # Clean and validate
-        valid_participants = []
-        for name in participants:
+        valid_participants = {
+            name for name in participants
             if (3 <= len(name) <= 25 and 
                 name.isalpha() and
-                name[0].isupper()):
-                valid_participants.append(name)
+                name[0].isupper())
+        }
         
-        return sorted(list(set(valid_participants)))[:8]
+        return sorted(valid_participants)[:8]
     
     def _get_sentence_containing(self, text: str, position: int) -> str:
         """Get the sentence containing a specific character position"""
@@ -839,9 +1052,10 @@ class NLPProcessor:
         
         return ""
     
-    def _categorize_action_item(self, text: str) -> str:
+    def _categorize_action_item(self, text: str, text_lower: Optional[str] = None) -> str:
         """Categorize action items by type"""
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         
         if any(word in text_lower for word in ["deadline", "due", "by"]):
             return "deadline"
@@ -6,8 +6,18 @@ and sentence transformers for embedding generation. It enables searching across
 meeting transcripts, action items, decisions, and other meeting content.
 """
 
+import asyncio
+import contextlib
 import os
+import re
 import json
+import copy
+import hashlib
+import heapq
+import time
+import threading
+from bisect import bisect_left
+from collections import Counter, OrderedDict
 import numpy as np
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
@@ -23,12 +33,144 @@ except ImportError as e:
     SentenceTransformer = None
 
 try:
-    from utils.performance import timing_decorator, ModelManager
+    import torch
 except ImportError:
-    # Fallback for when running as module
-    import sys
-    sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-    from utils.performance import timing_decorator, ModelManager
+    torch = None
+
+from utils.performance import timing_decorator, ModelManager
+
+
+# HNSW graph parameters for the ANN index
+HNSW_M = 32  # Neighbors per node
+HNSW_EF_CONSTRUCTION = 80  # Candidate list size while building
+HNSW_EF_SEARCH = 32  # Candidate list size while searching (FAISS raises it to k if needed)
+
+# Batches smaller than this are encoded on CPU even when a GPU is available:
+# for a handful of texts the host/device copies cost more than the forward pass
+GPU_MIN_BATCH = 16
+
+# Optional int8-quantized ONNX encoder used for CPU inference
+# (path to the .onnx file written by backend/scripts/quantize_encoder.py)
+ONNX_ENCODER_PATH = os.environ.get("SEARCH_ONNX_ENCODER")
+
+# IVF-PQ parameters used once the corpus is large enough to train the quantizers
+IVFPQ_TRAIN_THRESHOLD = 10000  # Vectors needed before switching from HNSW to IVF-PQ
+IVFPQ_NLIST = 256  # Coarse clusters
+IVFPQ_M = 48  # Sub-quantizers (384 dims -> 8 dims each)
+IVFPQ_NBITS = 8  # Bits per sub-quantizer code (48 bytes per vector instead of 1.5 KB)
+IVFPQ_NPROBE = 8  # Clusters visited per query
+
+# Relevance multipliers for content types that make better results
+CONTENT_TYPE_BOOSTS = {'transcript_summary': 1.2, 'action_item': 1.1, 'decision': 1.1}
+
+# Candidates fetched per requested type and result slot when one search serves several content types
+CONTENT_TYPE_OVERSAMPLE = 4
+
+# Phrases that usually open a new topic; used to place transcript chunk boundaries
+_TOPIC_BOUNDARY_RE = re.compile(r"agenda|next|moving on|let's discuss|regarding|in terms of|as for")
+
+
+class QueryCache:
+    """
+    Thread-safe LRU cache for ranked search results with a time-to-live
+    
+    Values are deep-copied on the way in and out so callers can freely
+    mutate the result dicts they receive.
+    """
+    
+    def __init__(self, max_size: int = 512, ttl_seconds: float = 300):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+    
+    def get(self, key) -> Optional[Any]:
+        """Return a copy of the cached value, or None on a miss or expired entry"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            
+            self._entries.move_to_end(key)
+            return copy.deepcopy(value)
+    
+    def put(self, key, value):
+        """Store a copy of value, evicting the least recently used entries"""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Drop all cached entries"""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class MetadataColumns:
+    """
+    Columnar (structure-of-arrays) view of the chunk metadata
+    
+    MeetingSearchEngine.metadata keeps one dict per chunk, which is also the
+    on-disk format. This class mirrors the fields used for filtering as
+    integer-coded NumPy arrays aligned with FAISS ids, so a content-type or
+    meeting filter is a single vectorized comparison instead of a dict lookup
+    per chunk.
+    """
+    
+    def __init__(self):
+        self.type_names: List[str] = []  # Code -> content type, in first-seen order
+        self.meeting_ids: List[str] = []  # Code -> meeting id, in first-seen order
+        self._type_codes: Dict[str, int] = {}
+        self._meeting_codes: Dict[str, int] = {}
+        self.content_types = np.empty(0, dtype=np.int16)
+        self.meetings = np.empty(0, dtype=np.int32)
+    
+    def __len__(self) -> int:
+        return len(self.content_types)
+    
+    @staticmethod
+    def _code(value: str, codes: Dict[str, int], names: List[str]) -> int:
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(names)
+            names.append(value)
+        return code
+    
+    def extend(self, rows: List[Dict[str, Any]]):
+        """Append the columns for newly indexed metadata rows"""
+        type_codes = np.fromiter(
+            (self._code(row['content_type'], self._type_codes, self.type_names) for row in rows),
+            dtype=np.int16, count=len(rows)
+        )
+        meeting_codes = np.fromiter(
+            (self._code(row['meeting_id'], self._meeting_codes, self.meeting_ids) for row in rows),
+            dtype=np.int32, count=len(rows)
+        )
+        self.content_types = np.concatenate([self.content_types, type_codes])
+        self.meetings = np.concatenate([self.meetings, meeting_codes])
+    
+    def rebuild(self, rows: List[Dict[str, Any]]):
+        """Replace all columns with ones built from rows"""
+        self.__init__()
+        self.extend(rows)
+    
+    def type_codes(self, content_types: List[str]) -> np.ndarray:
+        """Codes of the given content types (unknown types are ignored)"""
+        return np.array([self._type_codes[t] for t in content_types if t in self._type_codes], dtype=np.int16)
+    
+    def meeting_code(self, meeting_id: str) -> Optional[int]:
+        """Code of a meeting id, or None if no chunk of that meeting is indexed"""
+        return self._meeting_codes.get(meeting_id)
 
 
 class MeetingSearchEngine:
@@ -59,9 +201,25 @@ class MeetingSearchEngine:
         
         # Initialize components
         self.encoder = None
+        self._encoder_device = "cuda" if torch is not None and torch.cuda.is_available() else "cpu"
+        self._cpu_encoder = None  # CPU copy for small batches when the main encoder is on GPU
         self.index = None
         self.metadata = []  # Store document metadata
+        self._columns = MetadataColumns()  # Columnar copy of metadata used for filtering
         self.is_trained = False
+        self._index_mmapped = False  # True while self.index is a read-only view of the file on disk
+        self._index_size_mb: Optional[float] = None  # Cached on-disk index size
+        self._query_cache = QueryCache(max_size=512, ttl_seconds=300)
+        self._generation = 0  # Bumped whenever indexed content changes
+        self._stats_cache: Optional[Tuple[int, Dict[str, Any]]] = None  # (generation, statistics)
+        # Query string -> embedding; independent of index contents, so never invalidated
+        self._qvec_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._qvec_cache_size = 1024
+        self._qvec_lock = threading.Lock()
+        self._embedding_dedup_hits = 0  # Chunks that reused the embedding of an identical chunk
+        # Held by add_meetings while the index and metadata change, and by every reader around
+        # its FAISS lookup and metadata access (never while encoding), so worker threads are safe
+        self._index_lock = threading.RLock()
         
         # Ensure index directory exists
         os.makedirs(self.index_path, exist_ok=True)
@@ -74,15 +232,7 @@ class MeetingSearchEngine:
         try:
             # Load sentence transformer model
             if SentenceTransformer is not None:
-                model_manager = ModelManager()
-                cache_key = f"sentence_transformer_{self.model_name}"
-                
-                if cache_key in model_manager.models:
-                    self.encoder = model_manager.models[cache_key]
-                else:
-                    print(f"Loading sentence transformer: {self.model_name}")
-                    self.encoder = SentenceTransformer(self.model_name)
-                    model_manager.models[cache_key] = self.encoder
+                self.encoder = self._load_encoder(self._encoder_device)
             
             # Load existing index if available
             self._load_index()
@@ -91,6 +241,60 @@ class MeetingSearchEngine:
             logging.error(f"Error initializing search components: {e}")
             print(f"⚠️  Search functionality limited: {e}")
     
+    def _load_encoder(self, device: str):
+        """Load the sentence transformer on a device, shared through the ModelManager cache"""
+        model_manager = ModelManager()
+        cache_key = f"sentence_transformer_{self.model_name}"
+        if device != "cpu":
+            cache_key += f"_{device}"
+        
+        if device == "cpu" and ONNX_ENCODER_PATH:
+            encoder = self._load_onnx_encoder(model_manager, cache_key)
+            if encoder is not None:
+                return encoder
+        
+        if cache_key not in model_manager.models:
+            print(f"Loading sentence transformer: {self.model_name} ({device})")
+            if device == "cpu":
+                encoder = SentenceTransformer(self.model_name, device=device)
+            else:
+                # 16-bit weights on GPU halve memory traffic and use tensor cores; encode()
+                # upcasts to float32 when converting to numpy, so FAISS still gets float32
+                dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+                encoder = SentenceTransformer(self.model_name, device=device,
+                                              model_kwargs={"torch_dtype": dtype})
+            model_manager.models[cache_key] = encoder
+        return model_manager.models[cache_key]
+    
+    def _load_onnx_encoder(self, model_manager: ModelManager, cache_key: str):
+        """Load the quantized ONNX encoder, or return None to fall back to PyTorch"""
+        cache_key += "_onnx"
+        if cache_key in model_manager.models:
+            return model_manager.models[cache_key]
+        
+        # The exported model lives at <model dir>/onnx/<file>.onnx
+        model_dir = os.path.dirname(os.path.dirname(ONNX_ENCODER_PATH))
+        file_name = os.path.relpath(ONNX_ENCODER_PATH, model_dir)
+        try:
+            print(f"Loading quantized ONNX encoder: {ONNX_ENCODER_PATH}")
+            encoder = SentenceTransformer(model_dir, device="cpu", backend="onnx",
+                                          model_kwargs={"file_name": file_name})
+        except Exception as e:
+            logging.warning(f"Quantized ONNX encoder unavailable, using PyTorch: {e}")
+            encoder = None  # Remembered so other engines do not retry the load
+        
+        model_manager.models[cache_key] = encoder
+        return encoder
+    
+    def _encoder_for(self, batch_size: int):
+        """Pick the encoder for a batch: GPU for large batches, CPU for a few texts"""
+        if self._encoder_device == "cpu" or batch_size >= GPU_MIN_BATCH:
+            return self.encoder
+        
+        if self._cpu_encoder is None:
+            self._cpu_encoder = self._load_encoder("cpu")
+        return self._cpu_encoder
+    
     def _load_index(self) -> bool:
         """Load existing FAISS index and metadata"""
         index_file = os.path.join(self.index_path, "faiss.index")
@@ -98,12 +302,15 @@ class MeetingSearchEngine:
         
         try:
             if os.path.exists(index_file) and os.path.exists(metadata_file):
-                # Load FAISS index
-                self.index = faiss.read_index(index_file)
+                # Map the index instead of reading it; pages are loaded on first access
+                self.index = self._read_index_mmap(index_file)
+                if isinstance(self.index, faiss.IndexIVF):
+                    self.index.nprobe = IVFPQ_NPROBE
                 
                 # Load metadata
                 with open(metadata_file, 'r', encoding='utf-8') as f:
                     self.metadata = json.load(f)
+                self._columns.rebuild(self.metadata)
                 
                 self.is_trained = True
                 print(f"✅ Loaded search index with {len(self.metadata)} documents")
@@ -117,19 +324,80 @@ class MeetingSearchEngine:
         self._create_new_index()
         return False
     
+    @staticmethod
+    def _io_flags() -> int:
+        """FAISS read flags for a memory-mapped, read-only index (0 if unsupported)"""
+        return getattr(faiss, 'IO_FLAG_MMAP', 0) | getattr(faiss, 'IO_FLAG_READ_ONLY', 0)
+    
+    def _read_index_mmap(self, index_file: str):
+        """Read the index memory-mapped, falling back to a regular read"""
+        flags = self._io_flags()
+        if flags:
+            try:
+                index = faiss.read_index(index_file, flags)
+                self._index_mmapped = True
+                return index
+            except RuntimeError as e:
+                logging.warning(f"Memory-mapped index load failed, reading into memory: {e}")
+        
+        self._index_mmapped = False
+        return faiss.read_index(index_file)
+    
+    def _ensure_writable_index(self):
+        """Swap a memory-mapped index for an in-memory copy before it is modified"""
+        if not self._index_mmapped:
+            return
+        
+        try:
+            self.index = faiss.clone_index(self.index)
+        except RuntimeError:
+            # Some index types (e.g. IVF inverted lists) cannot be cloned - read the file instead
+            self.index = faiss.read_index(os.path.join(self.index_path, "faiss.index"))
+        self._index_mmapped = False
+        
+        if isinstance(self.index, faiss.IndexIVF):
+            self.index.nprobe = IVFPQ_NPROBE
+    
     def _create_new_index(self):
         """Create a new FAISS index"""
         try:
             if faiss is not None:
-                # Create FAISS index for inner product (cosine similarity)
-                self.index = faiss.IndexFlatIP(self.embedding_dim)
+                # HNSW graph over normalized embeddings: inner product == cosine similarity
+                self.index = faiss.IndexHNSWFlat(self.embedding_dim, HNSW_M, faiss.METRIC_INNER_PRODUCT)
+                self.index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+                self.index.hnsw.efSearch = HNSW_EF_SEARCH
                 self.metadata = []
+                self._columns = MetadataColumns()
                 self.is_trained = False
+                self._index_mmapped = False
                 print("✅ Created new search index")
         except Exception as e:
             logging.error(f"Error creating FAISS index: {e}")
             print(f"⚠️  Could not create search index: {e}")
     
+    def _maybe_compress_index(self):
+        """
+        Rebuild the HNSW index as IVF-PQ once it holds enough vectors to train
+        
+        Product quantization stores each vector in IVFPQ_M bytes instead of
+        embedding_dim float32 values; below the threshold HNSW is kept because
+        the quantizers cannot be trained reliably on so few vectors.
+        """
+        if isinstance(self.index, faiss.IndexIVF) or self.index.ntotal < IVFPQ_TRAIN_THRESHOLD:
+            return
+        
+        print(f"🗜️  Compressing search index with IVF-PQ ({self.index.ntotal} vectors)...")
+        vectors = self.index.reconstruct_n(0, self.index.ntotal)
+        
+        quantizer = faiss.IndexFlatIP(self.embedding_dim)
+        index = faiss.IndexIVFPQ(quantizer, self.embedding_dim, IVFPQ_NLIST,
+                                 IVFPQ_M, IVFPQ_NBITS, faiss.METRIC_INNER_PRODUCT)
+        index.train(vectors)
+        index.add(vectors)
+        index.nprobe = IVFPQ_NPROBE
+        
+        self.index = index
+    
     def _save_index(self):
         """Save FAISS index and metadata to disk"""
         try:
@@ -137,6 +405,7 @@ class MeetingSearchEngine:
                 # Save FAISS index
                 index_file = os.path.join(self.index_path, "faiss.index")
                 faiss.write_index(self.index, index_file)
+                self._index_size_mb = None  # Size changed - re-read on next request
                 
                 # Save metadata
                 metadata_file = os.path.join(self.index_path, "metadata.json")
@@ -166,18 +435,21 @@ class MeetingSearchEngine:
         try:
             print(f"🚀 Generating embeddings for {len(texts)} chunks...")
             
-            # OPTIMIZATION: Batch processing with optimized parameters
-            embeddings = self.encoder.encode(
-                texts, 
-                convert_to_numpy=True,
-                batch_size=16,  # Optimal batch size for speed
-                show_progress_bar=False,  # Disable progress bar for speed
-                normalize_embeddings=True  # Built-in normalization
-            )
+            # OPTIMIZATION: One batched forward pass, normalized by the encoder itself.
+            # encode() sorts the texts by length before forming mini-batches and restores the
+            # input order afterwards, so short action items are never padded to transcript length.
+            # Inference mode skips autograd graph and tensor version bookkeeping for the forward pass
+            with torch.inference_mode() if torch is not None else contextlib.nullcontext():
+                embeddings = self._encoder_for(len(texts)).encode(
+                    texts, 
+                    convert_to_numpy=True,
+                    batch_size=64,  # All chunks of a meeting usually fit in one batch
+                    show_progress_bar=False,  # Disable progress bar for speed
+                    normalize_embeddings=True  # Built-in normalization
+                )
             
-            # OPTIMIZATION: Skip manual normalization if already done
-            if not hasattr(self.encoder, 'normalize_embeddings') or not self.encoder.normalize_embeddings:
-                faiss.normalize_L2(embeddings)
+            # FAISS needs contiguous float32; no copy when already in that layout
+            embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
             
             print(f"✅ Generated {embeddings.shape[0]} embeddings in {embeddings.shape[1]} dimensions")
             return embeddings
@@ -198,47 +470,164 @@ class MeetingSearchEngine:
         Returns:
             True if successfully added, False otherwise
         """
+        return self.add_meetings([meeting_data])[0]
+    
+    def add_meetings(self, meetings: List[Dict[str, Any]],
+                     precomputed_embeddings: Optional[np.ndarray] = None) -> List[bool]:
+        """
+        Add several meetings to the search index at once
+        
+        The chunks of all meetings are embedded in one batched call, added to
+        FAISS in one call and saved to disk once, instead of once per meeting.
+        
+        Args:
+            meetings: Meeting dictionaries in the format add_meeting accepts
+            precomputed_embeddings: Optional normalized float32 matrix with one row per
+                searchable chunk, in indexing order (e.g. a memory-mapped .npy built by
+                backend/scripts/build_test_fixture.py). Skips the encoder when its shape
+                matches; only the shape is checked here, so compare chunk_digest(meetings)
+                with the digest saved alongside the matrix before passing it in.
+                
+        Returns:
+            One success flag per meeting, in input order
+        """
+        added = [False] * len(meetings)
         try:
-            if self.encoder is None or self.index is None:
+            if self.index is None or (self.encoder is None and precomputed_embeddings is None):
                 print("⚠️  Search components not available")
-                return False
+                return added
             
-            # Extract searchable content
-            searchable_texts = self._extract_searchable_content(meeting_data)
+            # Extract searchable content for every meeting before encoding anything
+            contents = []
+            for position, meeting_data in enumerate(meetings):
+                searchable_texts = self._extract_searchable_content(meeting_data)
+                if not searchable_texts['texts']:
+                    print("⚠️  No searchable content found in meeting")
+                    continue
+                contents.append((position, meeting_data, searchable_texts))
             
-            if not searchable_texts:
-                print("⚠️  No searchable content found in meeting")
-                return False
+            if not contents:
+                return added
+            
+            chunk_count = sum(len(searchable_texts['texts']) for _, _, searchable_texts in contents)
+            if precomputed_embeddings is not None and precomputed_embeddings.shape != (chunk_count, self.embedding_dim):
+                print(f"⚠️  Precomputed embeddings have shape {precomputed_embeddings.shape}, "
+                      f"expected ({chunk_count}, {self.embedding_dim}); encoding instead")
+                if self.encoder is None:
+                    return added
+                precomputed_embeddings = None
+            
+            if precomputed_embeddings is not None:
+                # Rows are used as-is (a memory-mapped file is read straight into FAISS)
+                embeddings = np.asarray(precomputed_embeddings, dtype=np.float32)
+            else:
+                # Identical chunks (repeated phrases, shared boilerplate) are embedded once and
+                # the vector is reused for every occurrence, so the index still gets one row per chunk
+                unique_text_to_idx: Dict[str, int] = {}
+                assignment = np.fromiter(
+                    (unique_text_to_idx.setdefault(text, len(unique_text_to_idx))
+                     for _, _, searchable_texts in contents for text in searchable_texts['texts']),
+                    dtype=np.int64
+                )
+                self._embedding_dedup_hits += len(assignment) - len(unique_text_to_idx)
+                
+                # Generate embeddings for every unique chunk of every meeting in a single batch
+                embeddings = self.generate_embeddings(list(unique_text_to_idx))
+                if len(unique_text_to_idx) < len(assignment):
+                    embeddings = embeddings[assignment]
+            
+            # Metadata for each text chunk, in the order the vectors are added
+            new_rows = []
+            for _, meeting_data, searchable_texts in contents:
+                meeting_id = meeting_data['id']
+                meeting_title = meeting_data.get('title', 'Untitled Meeting')
+                meeting_date = meeting_data.get('date', datetime.now().isoformat())
+                participants = meeting_data.get('participants', [])
+                start_position = len(self.metadata) + len(new_rows)
+                
+                new_rows.extend(
+                    {
+                        'meeting_id': meeting_id,
+                        'meeting_title': meeting_title,
+                        'meeting_date': meeting_date,
+                        'content_type': content_type,
+                        'text': text,
+                        'participants': participants,
+                        'index_position': start_position + i
+                    }
+                    for i, (text, content_type) in enumerate(zip(searchable_texts['texts'], searchable_texts['types']))
+                )
             
-            # Generate embeddings
-            embeddings = self.generate_embeddings(searchable_texts['texts'])
-            
-            # Add to FAISS index
-            self.index.add(embeddings)
-            
-            # Store metadata for each text chunk
-            for i, text in enumerate(searchable_texts['texts']):
-                metadata = {
-                    'meeting_id': meeting_data['id'],
-                    'meeting_title': meeting_data.get('title', 'Untitled Meeting'),
-                    'meeting_date': meeting_data.get('date', datetime.now().isoformat()),
-                    'content_type': searchable_texts['types'][i],
-                    'text': text,
-                    'participants': meeting_data.get('participants', []),
-                    'index_position': len(self.metadata)
-                }
-                self.metadata.append(metadata)
+            # Add to FAISS index in one call
+            with self._index_lock:
+                self._ensure_writable_index()
+                self.index.add(embeddings)
+                self._maybe_compress_index()
+                self._invalidate_caches()
+                
+                self.metadata.extend(new_rows)
+                self._columns.extend(new_rows)
             
             # Save index
             self._save_index()
             
-            print(f"✅ Added meeting '{meeting_data.get('title', 'Untitled')}' with {len(searchable_texts['texts'])} searchable chunks")
-            return True
+            for position, meeting_data, searchable_texts in contents:
+                added[position] = True
+                print(f"✅ Added meeting '{meeting_data.get('title', 'Untitled')}' with {len(searchable_texts['texts'])} searchable chunks")
+            return added
             
         except Exception as e:
-            logging.error(f"Error adding meeting to index: {e}")
+            logging.error(f"Error adding meetings to index: {e}")
             print(f"❌ Failed to add meeting: {e}")
-            return False
+            return [False] * len(meetings)
+    
+    def _encode_query(self, query: str) -> np.ndarray:
+        """Embed a search query, reusing the vector for repeated query strings"""
+        return self._encode_queries([query])
+    
+    def _encode_queries(self, queries: List[str]) -> np.ndarray:
+        """Embed queries as one (n, dim) matrix, encoding only the uncached ones in a single batch"""
+        with self._qvec_lock:
+            embeddings = [self._qvec_cache.get(query) for query in queries]
+            for query, embedding in zip(queries, embeddings):
+                if embedding is not None:
+                    self._qvec_cache.move_to_end(query)
+        
+        missing = list(dict.fromkeys(q for q, e in zip(queries, embeddings) if e is None))
+        if missing:
+            encoded = self.generate_embeddings(missing)
+            encoded.setflags(write=False)  # Rows are shared between calls - must not be mutated
+            fresh = {query: encoded[i:i + 1] for i, query in enumerate(missing)}
+            embeddings = [fresh[q] if e is None else e for q, e in zip(queries, embeddings)]
+            
+            with self._qvec_lock:
+                self._qvec_cache.update(fresh)
+                while len(self._qvec_cache) > self._qvec_cache_size:
+                    self._qvec_cache.popitem(last=False)
+        
+        if len(embeddings) == 1:
+            return embeddings[0]
+        return np.vstack(embeddings)
+    
+    def _invalidate_caches(self):
+        """Forget cached query results after the indexed content changes"""
+        self._generation += 1
+        self._query_cache.clear()
+    
+    def chunk_digest(self, meetings: List[Dict[str, Any]]) -> str:
+        """
+        Fingerprint of the chunks add_meetings would embed for these meetings
+        
+        Covers the model name and every chunk text in indexing order, so precomputed
+        embeddings can be checked against the meetings they are meant for; rewording a
+        chunk changes the digest even when the chunk count stays the same.
+        """
+        digest = hashlib.blake2s(self.model_name.encode('utf-8'), digest_size=16)
+        for meeting_data in meetings:
+            for text in self._extract_searchable_content(meeting_data)['texts']:
+                digest.update(b'\0')
+                digest.update(text.encode('utf-8', 'surrogatepass'))
+        return digest.hexdigest()
     
     def _extract_searchable_content(self, meeting_data: Dict[str, Any]) -> Dict[str, List[str]]:
         """
@@ -382,19 +771,20 @@ class MeetingSearchEngine:
         
         # Split by semantic boundaries (sentences + topic indicators)
         sentences = text.split('. ')
+        # Lowercase the whole text once; lowering never adds or removes '. ' so the split lines up
+        sentences_lower = text.lower().split('. ')
+        if len(sentences_lower) != len(sentences):
+            sentences_lower = [sentence.lower() for sentence in sentences]
+        
         chunks = []
         current_chunk = []
         current_length = 0
         
-        # Topic detection keywords for better boundaries
-        topic_keywords = ['agenda', 'next', 'moving on', 'let\'s discuss', 'regarding', 'in terms of', 'as for']
-        
-        for i, sentence in enumerate(sentences):
+        for sentence, sentence_lower in zip(sentences, sentences_lower):
             sentence_length = len(sentence)
-            sentence_lower = sentence.lower()
             
             # Check if this sentence starts a new topic
-            is_topic_boundary = any(keyword in sentence_lower for keyword in topic_keywords)
+            is_topic_boundary = _TOPIC_BOUNDARY_RE.search(sentence_lower) is not None
             
             # Force chunk break on topic boundaries or size limits
             should_break = (current_length + sentence_length > chunk_size and current_chunk) or \
@@ -411,6 +801,10 @@ class MeetingSearchEngine:
                         current_chunk.insert(0, overlap_text)
                 
                 chunks.append(". ".join(current_chunk) + ".")
+                if len(chunks) >= target_chunks:
+                    # Anything after this would be cut by the target below
+                    current_chunk = []
+                    break
                 current_chunk = [sentence.strip(".")]
                 current_length = sentence_length
             else:
@@ -459,63 +853,28 @@ class MeetingSearchEngine:
                 print("⚠️  No meetings indexed yet")
                 return []
             
-            # Generate query embedding
-            query_embedding = self.generate_embeddings([query])
-            
-            # Search FAISS index
-            scores, indices = self.index.search(query_embedding, min(top_k * 2, len(self.metadata)))
+            filters = (content_types, date_from, date_to, participants, min_relevance)
+            cache_key = self._search_cache_key(query, top_k, *filters)
+            cached = self._query_cache.get(cache_key)
+            if cached is not None:
+                print(f"🔍 Found {len(cached)} relevant results for: '{query}' (cached)")
+                return cached
             
-            # Prepare results
-            results = []
-            seen_meetings = set()
+            # Generate query embedding (reused across top_k / filter variants) before taking
+            # the index lock, so concurrent searches only wait for each other inside FAISS
+            query_embedding = self._encode_query(query)
             
-            for score, idx in zip(scores[0], indices[0]):
-                if idx >= len(self.metadata):
-                    continue
-                
-                metadata = self.metadata[idx]
-                
-                # Apply content type filter
-                if content_types and metadata['content_type'] not in content_types:
-                    continue
-                
-                # Apply advanced filters
-                if not self._passes_advanced_filters(metadata, score, date_from, date_to, participants, min_relevance):
-                    continue
-                
-                # ULTIMATE OPTIMIZATION: Enhanced result with quality scoring
-                # Boost scores for summary chunks and better content types
-                enhanced_score = float(score)
-                
-                # Quality boost for summary chunks
-                if metadata['content_type'] == 'transcript_summary':
-                    enhanced_score *= 1.2
-                elif metadata['content_type'] == 'action_item':
-                    enhanced_score *= 1.1
-                elif metadata['content_type'] == 'decision':
-                    enhanced_score *= 1.1
-                
-                # Create enhanced result
-                result = {
-                    'meeting_id': metadata['meeting_id'],
-                    'meeting_title': metadata['meeting_title'],
-                    'meeting_date': metadata['meeting_date'],
-                    'content_type': metadata['content_type'],
-                    'text': metadata['text'],
-                    'participants': metadata['participants'],
-                    'relevance_score': enhanced_score,
-                    'original_score': float(score),
-                    'snippet': self._create_snippet(metadata['text'], query),
-                    'chunk_size': len(metadata['text']),
-                    'quality_indicator': 'high' if len(metadata['text']) > 1000 else 'medium'
-                }
-                
-                results.append(result)
-                seen_meetings.add(metadata['meeting_id'])
-                
-                if len(results) >= top_k:
-                    break
+            with self._index_lock:
+                params, candidate_count = self._content_type_search_params(content_types)
+                if candidate_count == 0:
+                    results = []
+                else:
+                    # Search FAISS index, restricted to the requested content types
+                    scores, indices = self.index.search(query_embedding, min(top_k * 2, candidate_count), params=params)
+                    
+                    results = self._rank_hits(query, scores[0], indices[0], top_k, *filters)
             
+            self._query_cache.put(cache_key, results)
             print(f"🔍 Found {len(results)} relevant results for: '{query}'")
             return results
             
@@ -524,6 +883,249 @@ class MeetingSearchEngine:
             print(f"❌ Search failed: {e}")
             return []
     
+    async def search_async(self, query: str, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Awaitable search() for async callers
+        
+        Query encoding and the FAISS lookup run in a worker thread, so the event
+        loop keeps serving other requests meanwhile. Takes the same keyword
+        arguments as search(), which holds the index lock only around the
+        FAISS lookup and ranking.
+        """
+        return await asyncio.to_thread(self.search, query, **kwargs)
+    
+    @timing_decorator
+    def batch_search(self, queries: List[str], top_k: int = 10, content_types: Optional[List[str]] = None,
+                     date_from: Optional[str] = None, date_to: Optional[str] = None,
+                     participants: Optional[List[str]] = None,
+                     min_relevance: Optional[float] = None) -> List[List[Dict[str, Any]]]:
+        """
+        Run several searches with one encoder pass and one FAISS call
+        
+        Args:
+            queries: Search queries
+            top_k: Number of top results to return per query
+            content_types, date_from, date_to, participants, min_relevance:
+                Same filters as search(), applied to every query
+            
+        Returns:
+            One result list per query, in the same order as queries
+        """
+        try:
+            if self.encoder is None or self.index is None:
+                print("⚠️  Search components not available")
+                return [[] for _ in queries]
+            
+            if not self.metadata:
+                print("⚠️  No meetings indexed yet")
+                return [[] for _ in queries]
+            
+            filters = (content_types, date_from, date_to, participants, min_relevance)
+            cache_keys = [self._search_cache_key(query, top_k, *filters) for query in queries]
+            all_results = [self._query_cache.get(key) for key in cache_keys]
+            pending = [i for i, results in enumerate(all_results) if results is None]
+            
+            if pending:
+                query_matrix = self._encode_queries([queries[i] for i in pending])
+                
+                with self._index_lock:
+                    params, candidate_count = self._content_type_search_params(content_types)
+                    if candidate_count == 0:
+                        for i in pending:
+                            all_results[i] = []
+                    else:
+                        scores, indices = self.index.search(query_matrix, min(top_k * 2, candidate_count), params=params)
+                        
+                        for row, i in enumerate(pending):
+                            results = self._rank_hits(queries[i], scores[row], indices[row], top_k, *filters)
+                            self._query_cache.put(cache_keys[i], results)
+                            all_results[i] = results
+            
+            print(f"🔍 Ran {len(queries)} searches ({len(queries) - len(pending)} cached)")
+            return all_results
+            
+        except Exception as e:
+            logging.error(f"Error during batch search: {e}")
+            print(f"❌ Batch search failed: {e}")
+            return [[] for _ in queries]
+    
+    @timing_decorator
+    def search_by_content_types(self, query: str, content_types: List[str], top_k: int = 10,
+                                date_from: Optional[str] = None, date_to: Optional[str] = None,
+                                participants: Optional[List[str]] = None,
+                                min_relevance: Optional[float] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Search one query separately in several content types with a single FAISS call
+        
+        Equivalent to calling search(query, top_k, [content_type]) for each
+        type, but the candidates of all types are fetched in one oversampled
+        search and split by type afterwards.
+        
+        Args:
+            query: Search query
+            content_types: Content types to get results for
+            top_k: Number of top results to return per content type
+            date_from, date_to, participants, min_relevance:
+                Same filters as search(), applied to every content type
+            
+        Returns:
+            Dictionary mapping each content type to its result list
+        """
+        grouped = {content_type: [] for content_type in content_types}
+        try:
+            if self.encoder is None or self.index is None:
+                print("⚠️  Search components not available")
+                return grouped
+            
+            if not self.metadata:
+                print("⚠️  No meetings indexed yet")
+                return grouped
+            
+            filters = (date_from, date_to, participants, min_relevance)
+            cache_keys = {
+                content_type: self._search_cache_key(query, top_k, [content_type], *filters)
+                for content_type in content_types
+            }
+            pending = []
+            for content_type in content_types:
+                cached = self._query_cache.get(cache_keys[content_type])
+                if cached is None:
+                    pending.append(content_type)
+                else:
+                    grouped[content_type] = cached
+            
+            if pending:
+                query_embedding = self._encode_query(query)
+                
+                with self._index_lock:
+                    params, candidate_count = self._content_type_search_params(pending)
+                    if candidate_count == 0:
+                        for content_type in pending:
+                            self._query_cache.put(cache_keys[content_type], [])
+                    else:
+                        # Oversample so each type usually finds its top_k among the shared candidates
+                        k = min(top_k * len(pending) * CONTENT_TYPE_OVERSAMPLE, candidate_count)
+                        scores, indices = self.index.search(query_embedding, k, params=params)
+                        scores, indices = scores[0], indices[0]
+                        
+                        valid = (indices >= 0) & (indices < len(self.metadata))
+                        hit_types = np.full(len(indices), -1, dtype=self._columns.content_types.dtype)
+                        hit_types[valid] = self._columns.content_types[indices[valid]]
+                        
+                        for content_type in pending:
+                            in_type = np.isin(hit_types, self._columns.type_codes([content_type]))
+                            results = self._rank_hits(query, scores[in_type], indices[in_type], top_k,
+                                                      [content_type], *filters)
+                            if len(results) < top_k and k < candidate_count and content_type in self._columns.type_names:
+                                # Other types took the candidate slots; search this one on its own
+                                type_params, type_count = self._content_type_search_params([content_type])
+                                type_scores, type_indices = self.index.search(
+                                    query_embedding, min(top_k * 2, type_count), params=type_params
+                                )
+                                results = self._rank_hits(query, type_scores[0], type_indices[0], top_k,
+                                                          [content_type], *filters)
+                            
+                            self._query_cache.put(cache_keys[content_type], results)
+                            grouped[content_type] = results
+            
+            print(f"🔍 Searched '{query}' in {len(content_types)} content types ({len(content_types) - len(pending)} cached)")
+            return grouped
+            
+        except Exception as e:
+            logging.error(f"Error during content type search: {e}")
+            print(f"❌ Content type search failed: {e}")
+            return {content_type: [] for content_type in content_types}
+    
+    def _content_type_search_params(self, content_types: Optional[List[str]]) -> Tuple[Optional[Any], int]:
+        """
+        Build FAISS search parameters that only visit chunks of the given content types
+        
+        Pre-filtering inside the index keeps filtered-out chunks from using up
+        the top-k candidate slots.
+        
+        Returns:
+            (search parameters or None when unfiltered, number of searchable chunks)
+        """
+        if not content_types:
+            return None, len(self.metadata)
+        
+        ids = np.flatnonzero(
+            np.isin(self._columns.content_types, self._columns.type_codes(content_types))
+        ).astype(np.int64)
+        if ids.size == 0:
+            return None, 0
+        
+        selector = faiss.IDSelectorBatch(ids)
+        if isinstance(self.index, faiss.IndexIVF):
+            params = faiss.SearchParametersIVF(sel=selector, nprobe=IVFPQ_NPROBE)
+        else:
+            params = faiss.SearchParametersHNSW(sel=selector, efSearch=HNSW_EF_SEARCH)
+        return params, int(ids.size)
+    
+    def _search_cache_key(self, query: str, top_k: int, content_types: Optional[List[str]],
+                          date_from: Optional[str], date_to: Optional[str],
+                          participants: Optional[List[str]], min_relevance: Optional[float]) -> tuple:
+        """Key for the result cache; includes the index generation so stale entries never match"""
+        return (
+            self._generation,
+            query.strip().lower(),
+            top_k,
+            tuple(sorted(content_types)) if content_types else None,
+            date_from,
+            date_to,
+            tuple(sorted(participants)) if participants else None,
+            min_relevance
+        )
+    
+    def _rank_hits(self, query: str, scores: np.ndarray, indices: np.ndarray, top_k: int,
+                   content_types: Optional[List[str]], date_from: Optional[str], date_to: Optional[str],
+                   participants: Optional[List[str]], min_relevance: Optional[float]) -> List[Dict[str, Any]]:
+        """Turn one row of FAISS hits into filtered, score-boosted result dicts"""
+        results = []
+        
+        # HNSW pads with -1 when fewer than k neighbors are reachable
+        keep = (indices >= 0) & (indices < len(self.metadata))
+        
+        # Apply content type filter on the coded column in one comparison
+        if content_types:
+            keep[keep] = np.isin(self._columns.content_types[indices[keep]], self._columns.type_codes(content_types))
+        
+        for score, idx in zip(scores[keep], indices[keep]):
+            metadata = self.metadata[idx]
+            
+            # Apply advanced filters
+            if not self._passes_advanced_filters(metadata, score, date_from, date_to, participants, min_relevance):
+                continue
+            
+            # ULTIMATE OPTIMIZATION: Enhanced result with quality scoring
+            # Boost scores for summary chunks and better content types
+            enhanced_score = float(score)
+            
+            # Quality boost for summary chunks
+            enhanced_score *= CONTENT_TYPE_BOOSTS.get(metadata['content_type'], 1.0)
+            
+            # Create enhanced result
+            result = {
+                'meeting_id': metadata['meeting_id'],
+                'meeting_title': metadata['meeting_title'],
+                'meeting_date': metadata['meeting_date'],
+                'content_type': metadata['content_type'],
+                'text': metadata['text'],
+                'participants': metadata['participants'],
+                'relevance_score': enhanced_score,
+                'original_score': float(score),
+                'snippet': self._create_snippet(metadata['text'], query),
+                'chunk_size': len(metadata['text']),
+                'quality_indicator': 'high' if len(metadata['text']) > 1000 else 'medium'
+            }
+            
+            results.append(result)
+            
+            if len(results) >= top_k:
+                break
+        
+        return results
+    
     def _create_snippet(self, text: str, query: str, snippet_length: int = 200) -> str:
         """
         Create a snippet highlighting query terms
@@ -538,18 +1140,44 @@ class MeetingSearchEngine:
         """
         query_words = query.lower().split()
         text_lower = text.lower()
+        last_start = len(text) - snippet_length
         
-        # Find best position for snippet
+        # Find best position for snippet: the earliest window containing the most query words
         best_pos = 0
         max_matches = 0
         
-        for i in range(len(text) - snippet_length + 1):
-            snippet = text[i:i + snippet_length].lower()
-            matches = sum(1 for word in query_words if word in snippet)
+        if last_start >= 0 and query_words:
+            # Locate every occurrence once; a window starting at i contains an occurrence at p
+            # when i <= p <= i + reach
+            occurrences = []
+            for word, weight in Counter(query_words).items():
+                reach = snippet_length - len(word)
+                if reach < 0:
+                    continue
+                positions = []
+                pos = text_lower.find(word)
+                while pos != -1:
+                    positions.append(pos)
+                    pos = text_lower.find(word, pos + 1)
+                if positions:
+                    occurrences.append((weight, reach, positions))
+            
+            # Match counts only rise where an occurrence enters the window, so the
+            # best window starts at 0 or at one of those entry points
+            candidates = {0}
+            for _, reach, positions in occurrences:
+                candidates.update(max(0, p - reach) for p in positions if p - reach <= last_start)
             
-            if matches > max_matches:
-                max_matches = matches
-                best_pos = i
+            for i in sorted(candidates):
+                matches = 0
+                for weight, reach, positions in occurrences:
+                    j = bisect_left(positions, i)
+                    if j < len(positions) and positions[j] <= i + reach:
+                        matches += weight
+                
+                if matches > max_matches:
+                    max_matches = matches
+                    best_pos = i
         
         # Extract snippet
         snippet = text[best_pos:best_pos + snippet_length]
@@ -650,8 +1278,7 @@ class MeetingSearchEngine:
         if not dates:
             return {'earliest': '', 'latest': ''}
         
-        dates.sort()
-        return {'earliest': dates[0], 'latest': dates[-1]}
+        return {'earliest': min(dates), 'latest': max(dates)}
     
     def _calculate_person_relevance(self, text: str, target_participants: List[str]) -> float:
         """
@@ -742,10 +1369,15 @@ class MeetingSearchEngine:
         Returns:
             List of all content chunks for the meeting
         """
-        results = []
-        
-        for metadata in self.metadata:
-            if metadata['meeting_id'] == meeting_id:
+        with self._index_lock:
+            code = self._columns.meeting_code(meeting_id)
+            if code is None:
+                return []
+            
+            results = []
+            
+            for idx in np.flatnonzero(self._columns.meetings == code):
+                metadata = self.metadata[idx]
                 results.append({
                     'content_type': metadata['content_type'],
                     'text': metadata['text'],
@@ -753,8 +1385,8 @@ class MeetingSearchEngine:
                     'meeting_date': metadata['meeting_date'],
                     'participants': metadata['participants']
                 })
-        
-        return results
+            
+            return results
     
     def get_similar_meetings(self, meeting_id: str, top_k: int = 5) -> List[Dict[str, Any]]:
         """
@@ -788,42 +1420,47 @@ class MeetingSearchEngine:
             if not query_text:
                 return []
             
-            # Search for similar content
-            results = self.search(query_text, top_k * 3)
-            
-            # Group by meeting and calculate meeting-level similarity
-            meeting_scores = {}
-            for result in results:
-                if result['meeting_id'] == meeting_id:
-                    continue  # Skip the reference meeting
+            # Nearest chunks to the query, as search(query_text, top_k * 3) would rank them,
+            # but scored and grouped on the coded columns instead of building result dicts
+            query_embedding = self._encode_query(query_text)
+            with self._index_lock:
+                scores, indices = self.index.search(query_embedding, min(top_k * 6, len(self.metadata)))
+                scores, indices = scores[0], indices[0]
+                keep = (indices >= 0) & (indices < len(self.metadata))
+                scores, indices = scores[keep][:top_k * 3], indices[keep][:top_k * 3]
                 
-                mid = result['meeting_id']
-                if mid not in meeting_scores:
-                    meeting_scores[mid] = {
-                        'meeting_id': mid,
-                        'meeting_title': result['meeting_title'],
-                        'meeting_date': result['meeting_date'],
-                        'participants': result['participants'],
-                        'similarity_scores': [],
-                        'matching_content_types': set()
-                    }
+                boosts = np.array([CONTENT_TYPE_BOOSTS.get(name, 1.0) for name in self._columns.type_names])
+                similarities = scores.astype(np.float64) * boosts[self._columns.content_types[indices]]
                 
-                meeting_scores[mid]['similarity_scores'].append(result['relevance_score'])
-                meeting_scores[mid]['matching_content_types'].add(result['content_type'])
-            
-            # Calculate average similarity and sort
-            similar_meetings = []
-            for meeting_data in meeting_scores.values():
-                avg_score = sum(meeting_data['similarity_scores']) / len(meeting_data['similarity_scores'])
-                meeting_data['average_similarity'] = avg_score
-                meeting_data['matching_content_types'] = list(meeting_data['matching_content_types'])
-                del meeting_data['similarity_scores']  # Clean up
-                similar_meetings.append(meeting_data)
-            
-            # Sort by similarity and return top results
-            similar_meetings.sort(key=lambda x: x['average_similarity'], reverse=True)
+                # Skip the reference meeting
+                hit_meetings = self._columns.meetings[indices]
+                others = hit_meetings != self._columns.meeting_code(meeting_id)
+                indices, hit_meetings, similarities = indices[others], hit_meetings[others], similarities[others]
+                if indices.size == 0:
+                    return []
+                
+                # Average similarity per meeting in one pass
+                counts = np.bincount(hit_meetings)
+                average_similarity = np.bincount(hit_meetings, weights=similarities) / np.maximum(counts, 1)
+                
+                # One entry per meeting, in the order its first chunk was hit
+                meeting_codes, first_hits = np.unique(hit_meetings, return_index=True)
+                similar_meetings = []
+                for code, first in sorted(zip(meeting_codes.tolist(), first_hits.tolist()), key=lambda x: x[1]):
+                    metadata = self.metadata[indices[first]]
+                    similar_meetings.append({
+                        'meeting_id': metadata['meeting_id'],
+                        'meeting_title': metadata['meeting_title'],
+                        'meeting_date': metadata['meeting_date'],
+                        'participants': metadata['participants'],
+                        'matching_content_types': list({
+                            self.metadata[idx]['content_type'] for idx in indices[hit_meetings == code]
+                        }),
+                        'average_similarity': float(average_similarity[code])
+                    })
             
-            return similar_meetings[:top_k]
+            # Return the most similar meetings (partial selection, same order as a full sort)
+            return heapq.nlargest(top_k, similar_meetings, key=lambda x: x['average_similarity'])
             
         except Exception as e:
             logging.error(f"Error finding similar meetings: {e}")
@@ -840,31 +1477,38 @@ class MeetingSearchEngine:
         if not self.metadata:
             return {'total_documents': 0, 'total_meetings': 0}
         
-        # Count unique meetings
-        unique_meetings = set()
-        content_type_counts = {}
+        # Statistics only change when meetings are added, which bumps the generation
+        if self._stats_cache is not None and self._stats_cache[0] == self._generation:
+            return copy.deepcopy(self._stats_cache[1])
         
-        for metadata in self.metadata:
-            unique_meetings.add(metadata['meeting_id'])
-            
-            content_type = metadata['content_type']
-            content_type_counts[content_type] = content_type_counts.get(content_type, 0) + 1
+        # Count chunks per content type and unique meetings from the coded columns
+        type_counts = np.bincount(self._columns.content_types, minlength=len(self._columns.type_names))
+        content_type_counts = {
+            name: int(count) for name, count in zip(self._columns.type_names, type_counts) if count
+        }
+        unique_meetings = np.unique(self._columns.meetings)
         
-        return {
+        stats = {
             'total_documents': len(self.metadata),
             'total_meetings': len(unique_meetings),
             'content_type_distribution': content_type_counts,
             'index_size_mb': self._get_index_size(),
             'embedding_dimension': self.embedding_dim,
-            'model_name': self.model_name
+            'model_name': self.model_name,
+            'embedding_dedup_hits': self._embedding_dedup_hits
         }
+        self._stats_cache = (self._generation, stats)
+        return copy.deepcopy(stats)
     
     def _get_index_size(self) -> float:
-        """Get approximate index size in MB"""
+        """Get approximate index size in MB (cached until the index is saved again)"""
+        if self._index_size_mb is not None:
+            return self._index_size_mb
+        
         try:
             index_file = os.path.join(self.index_path, "faiss.index")
-            if os.path.exists(index_file):
-                return os.path.getsize(index_file) / (1024 * 1024)
-        except:
+            self._index_size_mb = os.stat(index_file).st_size / (1024 * 1024)
+            return self._index_size_mb
+        except OSError:
             pass
         return 0.0
@@ -8,10 +8,28 @@ import uuid
 import os
 import json
 import time
+import asyncio
+import threading
+from collections import OrderedDict
 from typing import Dict, Any, Optional
 from pathlib import Path
 import logging
 
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:
+    ScalableBloomFilter = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import aiofiles
+except ImportError:
+    aiofiles = None
+
 class SessionManager:
     """Manages user sessions with isolated data"""
     
@@ -20,10 +38,23 @@ class SessionManager:
         self.sessions_dir.mkdir(parents=True, exist_ok=True)
         self.active_sessions: Dict[str, Dict[str, Any]] = {}
         self.session_timeout = 3600  # 1 hour timeout
-        self.search_engines: Dict[str, Any] = {}  # Cache search engines per session
+        # Cache search engines per session, evicting the least recently used
+        self.search_engines: "OrderedDict[str, Any]" = OrderedDict()
+        self.search_engine_cache_size = int(os.environ.get("SEARCH_ENGINE_CACHE", 16))
+        self._disk_count_ttl = 5.0  # Seconds to reuse the on-disk session count
+        self._disk_count_cache: Optional[tuple] = None  # (timestamp, count)
+        # Every save gets a per-session version when it is scheduled; a write only lands
+        # if no later version is already on disk, whether it ran synchronously or as a task
+        self._save_state_lock = threading.Lock()
+        self._scheduled_versions: Dict[str, int] = {}
+        self._written_versions: Dict[str, int] = {}
+        self._pending_saves: set = set()  # Keeps background save tasks alive
         
         # Clean up old sessions on startup
         self._cleanup_expired_sessions()
+        
+        # Session IDs known to exist on disk, so unknown IDs skip the disk lookup
+        self._present = self._build_present_filter()
     
     def create_session(self) -> str:
         """Create a new session and return session ID"""
@@ -45,8 +76,10 @@ class SessionManager:
         search_index_dir.mkdir(exist_ok=True)
         
         # Store session data
+        self._present.add(session_id)
+        self._disk_count_cache = None
         self.active_sessions[session_id] = session_data
-        self._save_session_data(session_id, session_data)
+        self._schedule_save(session_id, session_data)
         
         logging.info(f"Created new session: {session_id}")
         return session_id
@@ -54,6 +87,10 @@ class SessionManager:
     def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get session data by ID"""
         if session_id not in self.active_sessions:
+            # Never seen on disk - no need to touch the filesystem
+            if session_id not in self._present:
+                return None
+            
             # Try to load from disk
             session_data = self._load_session_data(session_id)
             if session_data and not self._is_session_expired(session_data):
@@ -74,11 +111,12 @@ class SessionManager:
         # Add meeting to session
         meeting_data["session_id"] = session_id
         meeting_data["added_at"] = time.time()
+        meeting_data["chunk_count"] = len(meeting_data.get("searchable_chunks") or ())
         session["meetings"].append(meeting_data)
         
         # Update session
         self.active_sessions[session_id] = session
-        self._save_session_data(session_id, session)
+        self._schedule_save(session_id, session)
         
         logging.info(f"Added meeting to session {session_id}: {meeting_data.get('title', 'Untitled')}")
         return True
@@ -92,21 +130,43 @@ class SessionManager:
     
     def get_session_search_index_path(self, session_id: str) -> Optional[str]:
         """Get the search index path for a session"""
+        # The path never changes, so a session that is not in memory is answered from its header
+        if session_id not in self.active_sessions and session_id in self._present:
+            header = self._load_session_header(session_id)
+            if header and header.get("search_index_path") and not self._is_session_expired(header):
+                return header["search_index_path"]
+        
         session = self.get_session(session_id)
         if not session:
             return None
         return session.get("search_index_path")
     
     def get_or_create_search_engine(self, session_id: str):
-        """Get or create a search engine for a session"""
-        if session_id not in self.search_engines:
-            from models.search import MeetingSearchEngine
-            index_path = self.get_session_search_index_path(session_id)
-            if index_path:
-                self.search_engines[session_id] = MeetingSearchEngine(index_path=index_path)
-                print(f"🔍 Created search engine for session: {session_id[:8]}...")
+        """Get or create a search engine for a session
         
-        return self.search_engines.get(session_id)
+        Only the most recently used engines are kept in memory. Every engine
+        persists its index on each change, so an evicted one is simply
+        reloaded from disk on the next request.
+        """
+        engine = self.search_engines.get(session_id)
+        if engine is not None:
+            self.search_engines.move_to_end(session_id)
+            return engine
+        
+        from models.search import MeetingSearchEngine
+        index_path = self.get_session_search_index_path(session_id)
+        if not index_path:
+            return None
+        
+        engine = MeetingSearchEngine(index_path=index_path)
+        self.search_engines[session_id] = engine
+        print(f"🔍 Created search engine for session: {session_id[:8]}...")
+        
+        while len(self.search_engines) > self.search_engine_cache_size:
+            evicted_id, _ = self.search_engines.popitem(last=False)
+            logging.info(f"Evicted search engine for session: {evicted_id}")
+        
+        return engine
     
     def delete_session(self, session_id: str) -> bool:
         """Delete a session and all its data including search indexes"""
@@ -119,11 +179,16 @@ class SessionManager:
             if session_id in self.search_engines:
                 del self.search_engines[session_id]
             
+            with self._save_state_lock:
+                self._scheduled_versions.pop(session_id, None)
+                self._written_versions.pop(session_id, None)
+            
             # Remove session directory (includes search indexes)
             session_dir = self.sessions_dir / session_id
             if session_dir.exists():
                 import shutil
                 shutil.rmtree(session_dir)
+                self._disk_count_cache = None
                 logging.info(f"Deleted session directory: {session_id}")
             
             logging.info(f"Deleted session: {session_id}")
@@ -132,14 +197,127 @@ class SessionManager:
             logging.error(f"Error deleting session {session_id}: {e}")
             return False
     
-    def _save_session_data(self, session_id: str, session_data: Dict[str, Any]):
-        """Save session data to disk"""
+    def _build_present_filter(self):
+        """Collect the IDs of all sessions currently stored on disk
+        
+        Uses a Bloom filter when pybloom_live is installed, otherwise a set.
+        Deleted sessions are never removed: a stale entry only means
+        get_session falls through to the regular disk check.
+        """
+        present = (ScalableBloomFilter(initial_capacity=1024, error_rate=0.001)
+                   if ScalableBloomFilter is not None else set())
         try:
-            session_file = self.sessions_dir / session_id / "session.json"
-            with open(session_file, 'w') as f:
-                json.dump(session_data, f, indent=2)
+            with os.scandir(self.sessions_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        present.add(entry.name)
+        except Exception as e:
+            logging.error(f"Error scanning sessions directory: {e}")
+        return present
+    
+    def _serialize(self, data: Dict[str, Any], indent: bool = True) -> bytes:
+        """Serialize data to JSON bytes"""
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+            return orjson.dumps(data, option=option)
+        return json.dumps(data, indent=2 if indent else None).encode("utf-8")
+    
+    def _serialize_session(self, session_data: Dict[str, Any]) -> tuple:
+        """Serialize a session to (session.json bytes, header.json bytes)"""
+        meetings = session_data.get("meetings", [])
+        header = {
+            "id": session_data.get("id"),
+            "created_at": session_data.get("created_at"),
+            "last_activity": session_data.get("last_activity"),
+            "meeting_count": len(meetings),
+            "document_count": self._count_documents(meetings),
+            "search_index_path": session_data.get("search_index_path")
+        }
+        return self._serialize(session_data), self._serialize(header, indent=False)
+    
+    def _schedule_save(self, session_id: str, session_data: Dict[str, Any]):
+        """Save session data to disk, plus a small header for read-only lookups
+        
+        The data is serialized immediately (so later mutations don't leak into
+        this write). Inside an event loop it is written by a background task;
+        outside one it is written synchronously. Either way, saves for one
+        session land in the order they were scheduled.
+        """
+        try:
+            payload, header = self._serialize_session(session_data)
         except Exception as e:
             logging.error(f"Error saving session data: {e}")
+            return
+        
+        with self._save_state_lock:
+            version = self._scheduled_versions.get(session_id, 0) + 1
+            self._scheduled_versions[session_id] = version
+        files = (("session.json", payload), ("header.json", header))
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._save_session_data(session_id, version, files)
+            return
+        
+        task = loop.create_task(self._save_session_data_async(session_id, version, files))
+        self._pending_saves.add(task)
+        task.add_done_callback(self._pending_saves.discard)
+    
+    def _save_session_data(self, session_id: str, version: int, files: tuple):
+        """Write serialized session files synchronously"""
+        try:
+            session_dir = self.sessions_dir / session_id
+            if not session_dir.exists():
+                return  # Session was deleted before the write ran
+            
+            temp_files = []
+            for name, data in files:
+                temp = self._temp_path(session_dir, name, version)
+                with open(temp, 'wb') as f:
+                    f.write(data)
+                temp_files.append((temp, name))
+            self._replace_session_files(session_id, version, temp_files)
+        except Exception as e:
+            logging.error(f"Error saving session data: {e}")
+    
+    async def _save_session_data_async(self, session_id: str, version: int, files: tuple):
+        """Write serialized session files off the event loop"""
+        try:
+            session_dir = self.sessions_dir / session_id
+            if not session_dir.exists():
+                return  # Session was deleted before the write ran
+            
+            temp_files = []
+            for name, data in files:
+                temp = self._temp_path(session_dir, name, version)
+                if aiofiles is not None:
+                    async with aiofiles.open(temp, 'wb') as f:
+                        await f.write(data)
+                else:
+                    await asyncio.to_thread(temp.write_bytes, data)
+                temp_files.append((temp, name))
+            await asyncio.to_thread(self._replace_session_files, session_id, version, temp_files)
+        except Exception as e:
+            logging.error(f"Error saving session data: {e}")
+    
+    @staticmethod
+    def _temp_path(session_dir: Path, name: str, version: int) -> Path:
+        """Temporary file next to the target, so os.replace stays on one filesystem"""
+        return session_dir / f".{name}.{os.getpid()}.{version}.tmp"
+    
+    def _replace_session_files(self, session_id: str, version: int, temp_files: list):
+        """Atomically move written temp files into place, unless a newer save already landed"""
+        with self._save_state_lock:
+            if version > self._written_versions.get(session_id, 0):
+                for temp, name in temp_files:
+                    os.replace(temp, temp.parent / name)
+                self._written_versions[session_id] = version
+                return
+        
+        # Superseded by a save scheduled later
+        for temp, _ in temp_files:
+            temp.unlink(missing_ok=True)
     
     def _load_session_data(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Load session data from disk"""
@@ -152,6 +330,35 @@ class SessionManager:
             logging.error(f"Error loading session data: {e}")
         return None
     
+    def _load_session_header(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Load only the session header (id, timestamps, counts, index path) from disk
+        
+        Falls back to the full session file for sessions saved before
+        headers were written.
+        """
+        try:
+            header_file = self.sessions_dir / session_id / "header.json"
+            with open(header_file, 'rb') as f:
+                data = f.read()
+            return orjson.loads(data) if orjson is not None else json.loads(data)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.error(f"Error loading session header: {e}")
+        
+        session_data = self._load_session_data(session_id)
+        if session_data is None:
+            return None
+        meetings = session_data.get("meetings", [])
+        return {
+            "id": session_data.get("id"),
+            "created_at": session_data.get("created_at"),
+            "last_activity": session_data.get("last_activity"),
+            "meeting_count": len(meetings),
+            "document_count": self._count_documents(meetings),
+            "search_index_path": session_data.get("search_index_path")
+        }
+    
     def _is_session_expired(self, session_data: Dict[str, Any]) -> bool:
         """Check if session has expired"""
         last_activity = session_data.get("last_activity", 0)
@@ -160,34 +367,58 @@ class SessionManager:
     def _cleanup_expired_sessions(self):
         """Clean up ONLY expired sessions, preserve search data"""
         try:
-            for session_dir in self.sessions_dir.iterdir():
-                if session_dir.is_dir():
-                    session_file = session_dir / "session.json"
-                    if session_file.exists():
-                        session_data = self._load_session_data(session_dir.name)
-                        if session_data and self._is_session_expired(session_data):
+            with os.scandir(self.sessions_dir) as entries:
+                for entry in entries:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    session_file = os.path.join(entry.path, "session.json")
+                    if os.path.exists(session_file):
+                        header = self._load_session_header(entry.name)
+                        if header and self._is_session_expired(header):
                             # Only delete if session is truly expired
-                            self.delete_session(session_dir.name)
+                            self.delete_session(entry.name)
                     # DON'T delete orphaned directories - they might contain valuable search data
                     # Let them persist for potential recovery or manual cleanup
         except Exception as e:
             logging.error(f"Error cleaning up sessions: {e}")
     
+    @staticmethod
+    def _count_documents(meetings: list) -> int:
+        """Total number of searchable chunks across meetings"""
+        total_documents = 0
+        for meeting in meetings:
+            chunk_count = meeting.get("chunk_count")
+            if chunk_count is None:
+                # Sessions saved before chunk_count was recorded
+                chunks = meeting.get("searchable_chunks")
+                chunk_count = len(chunks) if chunks else 0
+            total_documents += chunk_count
+        return total_documents
+    
     def get_session_stats(self, session_id: str) -> Dict[str, Any]:
         """Get statistics for a session"""
-        session = self.get_session(session_id)
-        if not session:
-            return {"total_meetings": 0, "total_documents": 0}
+        if session_id in self.active_sessions:
+            session = self.get_session(session_id)
+            meetings = session.get("meetings", [])
+            return {
+                "total_meetings": len(meetings),
+                "total_documents": self._count_documents(meetings),
+                "session_id": session_id,
+                "created_at": session.get("created_at"),
+                "last_activity": session.get("last_activity")
+            }
         
-        meetings = session.get("meetings", [])
-        total_documents = sum(len(meeting.get("searchable_chunks", [])) for meeting in meetings)
+        # Not in memory: answer from the header without hydrating the session
+        header = self._load_session_header(session_id) if session_id in self._present else None
+        if not header or self._is_session_expired(header):
+            return {"total_meetings": 0, "total_documents": 0}
         
         return {
-            "total_meetings": len(meetings),
-            "total_documents": total_documents,
+            "total_meetings": header.get("meeting_count", 0),
+            "total_documents": header.get("document_count", 0),
             "session_id": session_id,
-            "created_at": session.get("created_at"),
-            "last_activity": session.get("last_activity")
+            "created_at": header.get("created_at"),
+            "last_activity": header.get("last_activity")
         }
     
     def clear_all_sessions(self) -> bool:
@@ -196,6 +427,7 @@ class SessionManager:
             # Clear active sessions
             self.active_sessions.clear()
             self.search_engines.clear()
+            self._disk_count_cache = None
             
             # Remove all session directories
             import shutil
@@ -209,10 +441,21 @@ class SessionManager:
             logging.error(f"Error clearing all sessions: {e}")
             return False
     
+    def _count_sessions_on_disk(self) -> int:
+        """Count session directories, reusing the result for a few seconds"""
+        now = time.monotonic()
+        if self._disk_count_cache and now - self._disk_count_cache[0] < self._disk_count_ttl:
+            return self._disk_count_cache[1]
+        
+        with os.scandir(self.sessions_dir) as entries:
+            count = sum(1 for entry in entries if entry.is_dir(follow_symlinks=False))
+        self._disk_count_cache = (now, count)
+        return count
+    
     def get_all_sessions_info(self) -> Dict[str, Any]:
         """Get information about all sessions (for debugging)"""
         try:
-            session_count = len(list(self.sessions_dir.iterdir()))
+            session_count = self._count_sessions_on_disk()
             active_count = len(self.active_sessions)
             search_engine_count = len(self.search_engines)
             
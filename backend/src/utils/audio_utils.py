@@ -7,16 +7,28 @@ converting them to text using the ASR processor.
 
 import os
 import asyncio
+import functools
 import logging
-from typing import Optional
+import subprocess
+from typing import Optional, Union
 from pathlib import Path
 
+import numpy as np
+
 try:
     from pydub import AudioSegment
 except ImportError:
     AudioSegment = None
     logging.warning("pydub not available - audio processing limited")
 
+# Supported extensions, built once at import time
+_SUPPORTED_FORMATS = {
+    'audio': ('.mp3', '.wav', '.m4a', '.flac', '.ogg', '.aac'),
+    'video': ('.mp4', '.avi', '.mov', '.mkv', '.webm', '.flv')
+}
+_AUDIO_EXT = frozenset(_SUPPORTED_FORMATS['audio'])
+_VIDEO_EXT = frozenset(_SUPPORTED_FORMATS['video'])
+
 async def process_audio_file(file_path: str, asr_processor) -> str:
     """
     Process an audio or video file and convert it to text
@@ -42,15 +54,10 @@ async def process_audio_file(file_path: str, asr_processor) -> str:
             transcript = await transcribe_audio(file_path, asr_processor)
             
         elif file_ext in ['.mp4', '.avi', '.mov', '.mkv', '.webm']:
-            # Video file - extract audio first
-            audio_path = await extract_audio_from_video(file_path)
-            try:
-                transcript = await transcribe_audio(audio_path, asr_processor)
-            finally:
-                # Clean up extracted audio file
-                if os.path.exists(audio_path):
-                    os.remove(audio_path)
-                    
+            # Video file - extract audio into memory first
+            audio = await extract_audio_from_video(file_path)
+            transcript = await transcribe_audio(audio, asr_processor)
+            
         else:
             raise ValueError(f"Unsupported file format: {file_ext}")
         
@@ -60,12 +67,12 @@ async def process_audio_file(file_path: str, asr_processor) -> str:
         logging.error(f"Error processing audio file {file_path}: {e}")
         raise
 
-async def transcribe_audio(audio_path: str, asr_processor) -> str:
+async def transcribe_audio(audio: Union[str, np.ndarray], asr_processor) -> str:
     """
-    Transcribe audio file using ASR processor
+    Transcribe audio using ASR processor
     
     Args:
-        audio_path: Path to audio file
+        audio: Path to audio file, or 16kHz mono float32 samples
         asr_processor: ASR processor instance
         
     Returns:
@@ -75,45 +82,37 @@ async def transcribe_audio(audio_path: str, asr_processor) -> str:
         if asr_processor is None:
             raise RuntimeError("ASR processor not available")
         
-        # Run transcription in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        transcript = await loop.run_in_executor(
-            None, 
-            asr_processor.transcribe, 
-            audio_path
-        )
-        
-        return transcript
+        # Run transcription in a worker thread to avoid blocking
+        return await asyncio.to_thread(asr_processor.transcribe, audio)
         
     except Exception as e:
-        logging.error(f"Error transcribing audio {audio_path}: {e}")
+        source = audio if isinstance(audio, str) else f"<{len(audio)} samples>"
+        logging.error(f"Error transcribing audio {source}: {e}")
         raise
 
-async def extract_audio_from_video(video_path: str) -> str:
+async def extract_audio_from_video(video_path: str) -> np.ndarray:
     """
     Extract audio from video file
     
+    The decoded PCM is streamed from ffmpeg's stdout, so no intermediate
+    WAV file is written to disk.
+    
     Args:
         video_path: Path to video file
         
     Returns:
-        Path to extracted audio file
+        16kHz mono audio samples as float32 in [-1.0, 1.0]
     """
     try:
-        # Use ffmpeg to extract audio
-        import subprocess
-        
-        output_path = video_path.rsplit('.', 1)[0] + '_audio.wav'
-        
-        # Run ffmpeg command
+        # Run ffmpeg command, writing raw PCM to stdout
         cmd = [
-            'ffmpeg', '-i', video_path,
+            'ffmpeg', '-nostdin', '-i', video_path,
             '-vn',  # No video
             '-acodec', 'pcm_s16le',  # PCM audio codec
             '-ar', '16000',  # Sample rate
             '-ac', '1',  # Mono
-            '-y',  # Overwrite output
-            output_path
+            '-f', 's16le',  # Raw PCM container
+            'pipe:1'
         ]
         
         # Run command
@@ -128,9 +127,9 @@ async def extract_audio_from_video(video_path: str) -> str:
         if process.returncode != 0:
             raise RuntimeError(f"FFmpeg failed: {stderr.decode()}")
         
-        return output_path
+        return np.frombuffer(stdout, dtype=np.int16).astype(np.float32) / 32768.0
         
-    except ImportError:
+    except FileNotFoundError:
         raise RuntimeError("FFmpeg not available - cannot extract audio from video")
     except Exception as e:
         logging.error(f"Error extracting audio from video {video_path}: {e}")
@@ -168,6 +167,8 @@ def get_audio_duration(file_path: str) -> float:
     """
     Get duration of audio file in seconds
     
+    Reads only the container header via ffprobe instead of decoding the file.
+    
     Args:
         file_path: Path to audio file
         
@@ -175,16 +176,32 @@ def get_audio_duration(file_path: str) -> float:
         Duration in seconds
     """
     try:
-        if AudioSegment is None:
-            raise RuntimeError("pydub not available")
-        
-        audio = AudioSegment.from_file(file_path)
-        return len(audio) / 1000.0  # Convert milliseconds to seconds
+        return _probe_duration(file_path, os.path.getmtime(file_path))
         
     except Exception as e:
         logging.error(f"Error getting audio duration: {e}")
         return 0.0
 
+@functools.lru_cache(maxsize=256)
+def _probe_duration(file_path: str, mtime: float) -> float:
+    """Run ffprobe for a file; mtime is part of the cache key so edits invalidate it"""
+    result = subprocess.run(
+        [
+            'ffprobe', '-v', 'error',
+            '-show_entries', 'format=duration',
+            '-of', 'default=noprint_wrappers=1:nokey=1',
+            file_path
+        ],
+        capture_output=True,
+        text=True,
+        timeout=5
+    )
+    
+    if result.returncode != 0:
+        raise RuntimeError(f"ffprobe failed: {result.stderr.strip()}")
+    
+    return float(result.stdout.strip() or 0.0)
+
 def is_audio_file(file_path: str) -> bool:
     """
     Check if file is an audio file
@@ -195,8 +212,7 @@ def is_audio_file(file_path: str) -> bool:
     Returns:
         True if audio file, False otherwise
     """
-    audio_extensions = {'.mp3', '.wav', '.m4a', '.flac', '.ogg', '.aac'}
-    return Path(file_path).suffix.lower() in audio_extensions
+    return os.path.splitext(file_path)[1].lower() in _AUDIO_EXT
 
 def is_video_file(file_path: str) -> bool:
     """
@@ -208,8 +224,7 @@ def is_video_file(file_path: str) -> bool:
     Returns:
         True if video file, False otherwise
     """
-    video_extensions = {'.mp4', '.avi', '.mov', '.mkv', '.webm', '.flv'}
-    return Path(file_path).suffix.lower() in video_extensions
+    return os.path.splitext(file_path)[1].lower() in _VIDEO_EXT
 
 def get_supported_formats() -> dict:
     """
@@ -218,7 +233,4 @@ def get_supported_formats() -> dict:
     Returns:
         Dictionary with supported formats
     """
-    return {
-        'audio': ['.mp3', '.wav', '.m4a', '.flac', '.ogg', '.aac'],
-        'video': ['.mp4', '.avi', '.mov', '.mkv', '.webm', '.flv']
-    }
+    return {kind: list(exts) for kind, exts in _SUPPORTED_FORMATS.items()}
@@ -4,17 +4,45 @@ Language Detection Utilities for Polyglot Meeting Assistant
 This module provides utilities for detecting languages in text and audio files.
 """
 
+import os
+import re
+import functools
+import itertools
 import logging
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, List, Optional
 
 try:
-    from langdetect import detect, detect_langs
+    from langdetect import detect_langs
     from langdetect.lang_detect_exception import LangDetectException
     LANGDETECT_AVAILABLE = True
 except ImportError:
     LANGDETECT_AVAILABLE = False
     logging.warning("langdetect not available. Install with: pip install langdetect")
 
+try:
+    import fasttext
+    FASTTEXT_AVAILABLE = True
+except ImportError:
+    fasttext = None
+    FASTTEXT_AVAILABLE = False
+
+# Letters in any script (word characters minus digits and underscore)
+_ALPHA_RE = re.compile(r'[^\W\d_]')
+_MIN_ALPHA_CHARS = 10  # Fewer letters than this in the sample cannot be classified
+_ALPHA_SAMPLE_SIZE = 200
+
+# fastText language identification model (lazy-loaded on first use). Download lid.176.bin from
+# https://fasttext.cc/docs/en/language-identification.html into backend/data, or point the
+# FASTTEXT_LID_MODEL environment variable at it; without the model, langdetect is used
+_DEFAULT_FASTTEXT_MODEL_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "data", "lid.176.bin"
+)
+FASTTEXT_MODEL_PATH = os.environ.get("FASTTEXT_LID_MODEL", _DEFAULT_FASTTEXT_MODEL_PATH)
+_LID = None
+_LID_FAILED = False
+_LID_LOCK = threading.Lock()
+
 # Language code mapping for better display
 LANGUAGE_NAMES = {
     'en': 'English',
@@ -73,10 +101,72 @@ LANGUAGE_NAMES = {
     'tl': 'Filipino'
 }
 
+def _get_lid_model():
+    """Load the fastText language identification model once, or return None"""
+    global _LID, _LID_FAILED
+    if _LID is not None or _LID_FAILED or not FASTTEXT_AVAILABLE:
+        return _LID
+    
+    with _LID_LOCK:
+        if _LID is None and not _LID_FAILED:
+            try:
+                _LID = fasttext.load_model(FASTTEXT_MODEL_PATH)
+                logging.info(f"Loaded fastText language model from {FASTTEXT_MODEL_PATH}")
+            except Exception as e:
+                _LID_FAILED = True
+                logging.warning(f"fastText model unavailable ({e}) - falling back to langdetect")
+    return _LID
+
+def _unknown_result(error: Optional[str] = None) -> Dict[str, Any]:
+    """Build the result returned when no language could be detected"""
+    result = {
+        'language': 'unknown',
+        'language_name': 'Unknown',
+        'confidence': 0.0,
+        'method': 'text_detection'
+    }
+    if error:
+        result['error'] = error
+    return result
+
+def _build_result(language: str, confidence: float, min_confidence: float) -> Dict[str, Any]:
+    """Build a detection result, marking it uncertain below the threshold"""
+    if confidence < min_confidence:
+        return {
+            'language': 'uncertain',
+            'language_name': 'Uncertain',
+            'confidence': confidence,
+            'method': 'text_detection'
+        }
+    
+    return {
+        'language': language,
+        'language_name': get_language_name(language),
+        'confidence': confidence,
+        'method': 'text_detection'
+    }
+
+def _is_detectable(text: str) -> bool:
+    """Check whether text is long enough and has enough letters to classify
+    
+    Rejects numbers, URLs, emoji and similar junk before it reaches the model.
+    """
+    if not text or len(text.strip()) < 20:
+        return False
+    
+    letters = _ALPHA_RE.finditer(text, 0, _ALPHA_SAMPLE_SIZE)
+    return sum(1 for _ in itertools.islice(letters, _MIN_ALPHA_CHARS)) >= _MIN_ALPHA_CHARS
+
+def _parse_fasttext_label(label: str) -> str:
+    """Convert a fastText label such as '__label__en' to a language code"""
+    return label.replace('__label__', '', 1)
+
 def detect_text_language(text: str, min_confidence: float = 0.7) -> Dict[str, Any]:
     """
     Detect language from text content
     
+    Uses the fastText lid.176 model when available and falls back to langdetect.
+    
     Args:
         text: Text content to analyze
         min_confidence: Minimum confidence threshold
@@ -84,63 +174,59 @@ def detect_text_language(text: str, min_confidence: float = 0.7) -> Dict[str, An
     Returns:
         Dictionary with language detection results
     """
-    if not LANGDETECT_AVAILABLE:
-        return {
-            'language': 'unknown',
-            'language_name': 'Unknown',
-            'confidence': 0.0,
-            'method': 'text_detection',
-            'error': 'langdetect not available'
-        }
+    lid = _get_lid_model()
     
-    if not text or len(text.strip()) < 20:
-        return {
-            'language': 'unknown',
-            'language_name': 'Unknown',
-            'confidence': 0.0,
-            'method': 'text_detection'
-        }
+    if lid is None and not LANGDETECT_AVAILABLE:
+        return _unknown_result('langdetect not available')
+    
+    if not _is_detectable(text):
+        return _unknown_result()
+    
+    if lid is not None:
+        # fastText rejects newlines in its input
+        labels, probs = lid.predict(text.replace('\n', ' '), k=1)
+        return _build_result(_parse_fasttext_label(labels[0]), float(probs[0]), min_confidence)
     
     try:
-        # Get primary language
-        primary_lang = detect(text)
-        
-        # Get all possible languages with probabilities
+        # Languages are returned sorted by probability, so the first is the primary
         all_langs = detect_langs(text)
-        
-        # Find confidence for primary language
-        confidence = 0.0
-        for lang_prob in all_langs:
-            if lang_prob.lang == primary_lang:
-                confidence = lang_prob.prob
-                break
-        
-        # Check if confidence meets threshold
-        if confidence < min_confidence:
-            return {
-                'language': 'uncertain',
-                'language_name': 'Uncertain',
-                'confidence': confidence,
-                'method': 'text_detection'
-            }
-        
-        return {
-            'language': primary_lang,
-            'language_name': LANGUAGE_NAMES.get(primary_lang, primary_lang.upper()),
-            'confidence': confidence,
-            'method': 'text_detection'
-        }
+        primary = all_langs[0]
+        return _build_result(primary.lang, primary.prob, min_confidence)
         
     except LangDetectException as e:
         logging.warning(f"Language detection failed: {e}")
-        return {
-            'language': 'unknown',
-            'language_name': 'Unknown',
-            'confidence': 0.0,
-            'method': 'text_detection',
-            'error': str(e)
-        }
+        return _unknown_result(str(e))
+
+def detect_text_languages_batch(texts: List[str], min_confidence: float = 0.7) -> List[Dict[str, Any]]:
+    """
+    Detect languages for many texts at once
+    
+    With fastText, all classifiable texts are scored in a single predict call;
+    otherwise each text goes through detect_text_language.
+    
+    Args:
+        texts: Text contents to analyze
+        min_confidence: Minimum confidence threshold
+        
+    Returns:
+        List of language detection results, in the same order as texts
+    """
+    lid = _get_lid_model()
+    if lid is None:
+        return [detect_text_language(text, min_confidence) for text in texts]
+    
+    results: List[Dict[str, Any]] = [_unknown_result() for _ in texts]
+    positions = [i for i, text in enumerate(texts) if _is_detectable(text)]
+    if not positions:
+        return results
+    
+    labels, probs = lid.predict([texts[i].replace('\n', ' ') for i in positions], k=1)
+    for i, label, prob in zip(positions, labels, probs):
+        results[i] = _build_result(_parse_fasttext_label(label[0]), float(prob[0]), min_confidence)
+    
+    return results
 
+@functools.lru_cache(maxsize=128)
 def get_language_name(language_code: str) -> str:
     """
     Get language name from language code
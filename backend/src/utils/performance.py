@@ -2,57 +2,65 @@ import time
 import functools
 import logging
 import os
+import threading
 from typing import Callable, Any
 
+_log = logging.getLogger(__name__)
+
 def timing_decorator(func: Callable) -> Callable:
     """Decorator to measure function execution time"""
     @functools.wraps(func)
     def wrapper(*args, **kwargs) -> Any:
-        start_time = time.time()
+        start = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        end_time = time.time()
+        elapsed_ns = time.perf_counter_ns() - start
         
-        execution_time = end_time - start_time
-        logging.info(f"{func.__name__} executed in {execution_time:.2f} seconds")
+        if _log.isEnabledFor(logging.INFO):
+            _log.info("%s executed in %.3f ms", func.__name__, elapsed_ns / 1e6)
         
         return result
     return wrapper
 
+def _create_asr(**kwargs):
+    from models.asr import WhisperASR
+    return WhisperASR(**kwargs)
+
+def _create_nlp(**kwargs):
+    from models.nlp import NLPProcessor
+    return NLPProcessor(**kwargs)
+
+def _create_search(**kwargs):
+    from models.search import MeetingSearchEngine
+    return MeetingSearchEngine(**kwargs)
+
+# Model type -> constructor, imported lazily so heavy deps load on demand
+_FACTORIES = {
+    "asr": _create_asr,
+    "nlp": _create_nlp,
+    "search": _create_search,
+}
+
 class ModelManager:
     """Singleton pattern for managing model instances"""
     _instances = {}
+    _lock = threading.RLock()
     models = {}  # Add models attribute for storing model instances
     
     @classmethod
     def get_model(cls, model_type: str, **kwargs):
-        """Get or create model instance"""
-        if model_type not in cls._instances:
-            if model_type == "asr":
-                try:
-                    from models.asr import WhisperASR
-                except ImportError:
-                    import sys
-                    sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-                    from models.asr import WhisperASR
-                cls._instances[model_type] = WhisperASR(**kwargs)
-            elif model_type == "nlp":
-                try:
-                    from models.nlp import NLPProcessor
-                except ImportError:
-                    import sys
-                    sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-                    from models.nlp import NLPProcessor
-                cls._instances[model_type] = NLPProcessor(**kwargs)
-            elif model_type == "search":
-                try:
-                    from models.search import MeetingSearchEngine
-                except ImportError:
-                    import sys
-                    sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-                    from models.search import MeetingSearchEngine
-                cls._instances[model_type] = MeetingSearchEngine(**kwargs)
-            else:
-                raise ValueError(f"Unknown model type: {model_type}")
+        """Get or create model instance (thread-safe)"""
+        instance = cls._instances.get(model_type)
+        if instance is not None:
+            return instance
+        
+        factory = _FACTORIES.get(model_type)
+        if factory is None:
+            raise ValueError(f"Unknown model type: {model_type}")
+        
+        with cls._lock:
+            # Re-check: another thread may have created it while we waited
+            if model_type not in cls._instances:
+                cls._instances[model_type] = factory(**kwargs)
         
         return cls._instances[model_type]
     
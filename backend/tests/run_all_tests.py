@@ -2,49 +2,88 @@
 
 import sys
 import os
+import asyncio
 import subprocess
 import time
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-def run_test_file(test_file):
-    """Run a single test file and return success status"""
+TEST_TIMEOUT = 300  # 5 minute timeout per test file
+OUTPUT_TAIL_BYTES = 4096  # Enough for the last 500 characters, even with emoji
+# Every test file loads its own copy of the models, so only a couple run at once by default;
+# set TEST_PARALLELISM to run more (or 1 to run them one by one)
+MAX_PARALLEL = max(1, int(os.environ.get("TEST_PARALLELISM", 2)))
+
+async def run_test_file(test_file, semaphore):
+    """Run a single test file in a subprocess and return its outcome"""
+    async with semaphore:
+        try:
+            process = await asyncio.create_subprocess_exec(
+                sys.executable, test_file,
+                cwd=os.path.dirname(__file__) or None,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+        except Exception as e:
+            return test_file, 'error', '', str(e)
+        
+        try:
+            stdout, stderr, _ = await asyncio.wait_for(
+                asyncio.gather(
+                    read_tail(process.stdout, OUTPUT_TAIL_BYTES),
+                    read_tail(process.stderr, OUTPUT_TAIL_BYTES),
+                    process.wait()
+                ),
+                timeout=TEST_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            return test_file, 'timeout', '', ''
+        
+        status = 'passed' if process.returncode == 0 else 'failed'
+        return (
+            test_file,
+            status,
+            stdout.decode(errors='replace'),
+            stderr.decode(errors='replace')
+        )
+
+async def read_tail(stream, max_bytes):
+    """Drain a stream, keeping only its last max_bytes bytes"""
+    tail = bytearray()
+    while True:
+        chunk = await stream.read(65536)
+        if not chunk:
+            return bytes(tail)
+        tail += chunk
+        if len(tail) > max_bytes:
+            del tail[:-max_bytes]
+
+def report_test_result(test_file, status, stdout, stderr):
+    """Print the outcome of a single test file and return success status"""
     print(f"\n🧪 Running: {test_file}")
     print("=" * 60)
     
-    try:
-        # Run the test file
-        result = subprocess.run([
-            sys.executable, test_file
-        ], 
-        cwd=os.path.dirname(__file__),
-        capture_output=True,
-        text=True,
-        timeout=300  # 5 minute timeout
-        )
-        
-        if result.returncode == 0:
-            print(f"✅ {test_file} - PASSED")
-            if result.stdout:
-                print(result.stdout[-500:])  # Last 500 chars of output
-            return True
-        else:
-            print(f"❌ {test_file} - FAILED")
-            if result.stderr:
-                print("Error output:")
-                print(result.stderr)
-            return False
-            
-    except subprocess.TimeoutExpired:
+    if status == 'passed':
+        print(f"✅ {test_file} - PASSED")
+        if stdout:
+            print(stdout[-500:])  # Last 500 chars of output
+        return True
+    elif status == 'timeout':
         print(f"⏰ {test_file} - TIMEOUT (5 minutes)")
-        return False
-    except Exception as e:
-        print(f"❌ {test_file} - ERROR: {e}")
-        return False
+    elif status == 'error':
+        print(f"❌ {test_file} - ERROR: {stderr}")
+    else:
+        print(f"❌ {test_file} - FAILED")
+        if stderr:
+            print("Error output:")
+            print(stderr)
+    return False
 
-def run_all_tests():
-    """Run all test files in the tests directory"""
+async def run_all_tests():
+    """Run all test files in the tests directory concurrently"""
     print("🚀 POLYGLOT MEETING ASSISTANT - COMPREHENSIVE TEST SUITE")
     print("=" * 80)
     
@@ -68,15 +107,18 @@ def run_all_tests():
         else:
             print(f"⚠️  Test file not found: {test_file}")
     
-    print(f"📋 Found {len(existing_tests)} test files to run")
+    print(f"📋 Found {len(existing_tests)} test files to run ({MAX_PARALLEL} in parallel)")
     
     # Run tests
     start_time = time.time()
+    semaphore = asyncio.Semaphore(MAX_PARALLEL)
+    outcomes = await asyncio.gather(*(run_test_file(test_file, semaphore) for test_file in existing_tests))
+    
     passed = 0
     failed = 0
     
-    for test_file in existing_tests:
-        if run_test_file(test_file):
+    for outcome in outcomes:
+        if report_test_result(*outcome):
             passed += 1
         else:
             failed += 1
@@ -141,6 +183,11 @@ Usage:
   python run_all_tests.py demo     # Run search engine demo
   python run_all_tests.py help     # Show this help
 
+  The NLP tests only check extraction logic; to skip the full PyTorch
+  summarizer, point them at the int8 ONNX export first:
+  NLP_ONNX_SUMMARIZER=data/summarizer_onnx python run_all_tests.py
+  (build it with backend/scripts/quantize_summarizer.py)
+
 Available tests:
   - test_search_simple.py          # Basic search functionality
   - test_search_engine.py          # Comprehensive search tests
@@ -155,5 +202,5 @@ Available tests:
             print(f"Unknown command: {sys.argv[1]}")
             print("Use 'help' to see available commands")
     else:
-        success = run_all_tests()
+        success = asyncio.run(run_all_tests())
         sys.exit(0 if success else 1)
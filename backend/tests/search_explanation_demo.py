@@ -2,8 +2,6 @@
 
 import sys
 import os
-import uuid
-from datetime import datetime
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -35,6 +33,9 @@ Instead of just matching keywords, it understands the MEANING of what you're loo
     """)
     
     try:
+        # Imported here so loading this module does not pull in torch/transformers
+        import uuid
+        from datetime import datetime
         from models.search import MeetingSearchEngine
         
         # Initialize search engine
@@ -45,7 +46,7 @@ Instead of just matching keywords, it understands the MEANING of what you're loo
         # Create a sample meeting to demonstrate
         print("\n📝 ADDING A SAMPLE MEETING...")
         sample_meeting = {
-            'id': str(uuid.uuid4()),
+            'id': uuid.uuid4().hex,
             'title': 'Product Launch Strategy Meeting',
             'date': datetime.now().isoformat(),
             'transcript': '''
@@ -111,21 +112,27 @@ Instead of just matching keywords, it understands the MEANING of what you're loo
                 }
             ]
             
-            for i, demo in enumerate(demo_queries, 1):
+            # One encoder pass and one index lookup for all demo queries
+            batch_results = search_engine.batch_search([demo['query'] for demo in demo_queries], top_k=3)
+            
+            for i, (demo, results) in enumerate(zip(demo_queries, batch_results), 1):
                 print(f"\n{i}. QUERY: '{demo['query']}'")
                 print(f"   PURPOSE: {demo['explanation']}")
                 print("   " + "-" * 50)
                 
-                results = search_engine.search(demo['query'], top_k=3)
-                
                 if results:
+                    # Format every result first and write the block in one call
+                    lines = []
                     for j, result in enumerate(results, 1):
-                        print(f"   ✅ RESULT {j}:")
-                        print(f"      Meeting: {result['meeting_title']}")
-                        print(f"      Content Type: {result['content_type']}")
-                        print(f"      Relevance Score: {result['relevance_score']:.3f}")
-                        print(f"      Found Text: {result['snippet'][:100]}...")
-                        print()
+                        lines += [
+                            f"   ✅ RESULT {j}:",
+                            f"      Meeting: {result['meeting_title']}",
+                            f"      Content Type: {result['content_type']}",
+                            f"      Relevance Score: {result['relevance_score']:.3f}",
+                            f"      Found Text: {result['snippet'][:100]}...",
+                            "",
+                        ]
+                    print("\n".join(lines))
                 else:
                     print("   ❌ No results found")
             
@@ -0,0 +1,22 @@
+"""
+Shared NLPProcessor for the NLP test modules
+
+Works under pytest and when a test module runs as a plain script, since the
+script's own directory is on sys.path either way.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from models.nlp import NLPProcessor
+
+_nlp_singleton = None
+
+def get_nlp() -> "NLPProcessor":
+    """Return a shared NLPProcessor so models are loaded once per process"""
+    global _nlp_singleton
+    if _nlp_singleton is None:
+        # Imported on first use so collecting the tests doesn't load the transformer stack
+        from models.nlp import NLPProcessor
+        _nlp_singleton = NLPProcessor()
+    return _nlp_singleton
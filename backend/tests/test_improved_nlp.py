@@ -2,9 +2,13 @@
 
 import sys
 import os
+from typing import TYPE_CHECKING
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from models.nlp import NLPProcessor
+from shared_nlp import get_nlp
+
+if TYPE_CHECKING:
+    from models.nlp import NLPProcessor
 
 def test_comprehensive_meeting():
     """Test comprehensive meeting analysis with improved extraction"""
@@ -53,7 +57,7 @@ def test_comprehensive_meeting():
     print("🧪 Testing Improved NLP Analysis...")
     print("=" * 60)
     
-    nlp = NLPProcessor()
+    nlp = get_nlp()
     
     # Test comprehensive analysis
     result = nlp.generate_comprehensive_summary(test_transcript)
@@ -138,7 +142,7 @@ def test_complex_engineering_meeting():
     print("\n🧪 Testing Engineering Meeting Analysis...")
     print("=" * 60)
     
-    nlp = NLPProcessor()
+    nlp = get_nlp()
     result = nlp.generate_comprehensive_summary(engineering_meeting)
     
     print("📝 SUMMARY:")
@@ -5,44 +5,61 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from models.search import MeetingSearchEngine
-from models.nlp import NLPProcessor
-from models.asr import WhisperASR
+from collections import Counter
 from datetime import datetime
+import functools
+import logging
+import re
+import tempfile
 import uuid
 
-def test_search_engine_setup():
-    """Test search engine initialization"""
-    print("🔍 TESTING: Search Engine Initialization")
-    print("=" * 50)
-    
-    try:
-        # Initialize search engine
-        search_engine = MeetingSearchEngine()
-        
-        # Get initial statistics
-        stats = search_engine.get_search_statistics()
-        
-        print(f"✅ Search engine initialized")
-        print(f"   Model: {stats.get('model_name', 'N/A')}")
-        print(f"   Embedding dimension: {stats.get('embedding_dimension', 'N/A')}")
-        print(f"   Documents indexed: {stats.get('total_documents', 0)}")
-        print(f"   Meetings indexed: {stats.get('total_meetings', 0)}")
-        
-        return search_engine
-        
-    except Exception as e:
-        print(f"❌ Search engine initialization failed: {e}")
-        return None
+try:
+    import pytest
+except ImportError:
+    pytest = None  # Still runnable as a plain script
+
+logger = logging.getLogger(__name__)
+
+# Built by backend/scripts/build_test_fixture.py; the fixture falls back to encoding without
+# them, or when the digest of the current sample chunks differs from the saved one
+SAMPLE_EMBEDDINGS_PATH = os.path.join(os.path.dirname(__file__), 'fixtures', 'sample_embeddings.npy')
+SAMPLE_DIGEST_PATH = os.path.join(os.path.dirname(__file__), 'fixtures', 'sample_embeddings.digest')
+
+def test_search_engine_setup(tmp_path):
+    """Test search engine initialization in a scratch index directory (never the shared data/search_index)"""
+    logger.info("🔍 TESTING: Search Engine Initialization")
+    logger.info("=" * 50)
+    
+    # Errors propagate, so a broken encoder or index fails the test instead of being logged
+    search_engine = MeetingSearchEngine(index_path=str(tmp_path))
+    assert search_engine.encoder is not None, "Sentence transformer failed to load"
+    assert search_engine.index is not None, "FAISS index failed to initialize"
+    
+    # A fresh directory starts with an empty index
+    stats = search_engine.get_search_statistics()
+    assert stats.get('total_documents') == 0
+    
+    logger.info("✅ Search engine initialized")
+    logger.info("   Model: %s", search_engine.model_name)
+    logger.info("   Embedding dimension: %s", search_engine.embedding_dim)
+
+# Sample meeting ids are derived from their titles, so they are the same on every run
+_SAMPLE_MEETING_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_DNS, 'tests.polyglot-meeting-assistant')
 
+def _compact(text: str) -> str:
+    """Collapse the indentation and blank lines of a triple-quoted transcript into single spaces"""
+    return re.sub(r'\s+', ' ', text).strip()
+
+@functools.lru_cache(maxsize=1)
 def create_sample_meetings():
-    """Create sample meeting data for testing"""
+    """Create sample meeting data for testing (built once per process; treat as read-only)"""
     
     meetings = [
         {
-            'id': str(uuid.uuid4()),
+            'id': str(uuid.uuid5(_SAMPLE_MEETING_NAMESPACE, 'Q4 Strategic Planning Meeting')),
             'title': 'Q4 Strategic Planning Meeting',
             'date': '2024-12-01T09:00:00',
-            'transcript': '''
+            'transcript': _compact('''
             CEO Sarah: Good morning everyone. We need to finalize our Q4 strategy and discuss budget allocations for 2025.
             
             CFO Michael: Thank you Sarah. I've prepared the financial projections. We're looking at 15% growth in Q4.
@@ -58,7 +75,7 @@ def create_sample_meetings():
             Lisa: We also need to decide on the marketing channels for our product launch.
             
             David: I agree with Sarah. We should prioritize the cloud migration in Q1 2025.
-            ''',
+            '''),
             'participants': ['Sarah', 'Michael', 'Lisa', 'David'],
             'summary': 'Strategic planning meeting focused on Q4 strategy, budget allocations for 2025, product launch campaign approval, and technology infrastructure upgrades.',
             'action_items': [
@@ -78,10 +95,10 @@ def create_sample_meetings():
         },
         
         {
-            'id': str(uuid.uuid4()),
+            'id': str(uuid.uuid5(_SAMPLE_MEETING_NAMESPACE, 'Technical Architecture Review')),
             'title': 'Technical Architecture Review',
             'date': '2024-11-28T14:00:00',
-            'transcript': '''
+            'transcript': _compact('''
             Lead Architect Alex: Today we're reviewing our microservices architecture and discussing the database migration.
             
             Senior Engineer Maya: The user authentication service is ready for production deployment.
@@ -97,7 +114,7 @@ def create_sample_meetings():
             Carlos: We need to migrate the legacy database by end of month.
             
             Nina: I recommend implementing circuit breakers for better resilience.
-            ''',
+            '''),
             'participants': ['Alex', 'Maya', 'Carlos', 'Nina'],
             'summary': 'Technical review covering microservices architecture, database migration progress, authentication service deployment, and infrastructure improvements.',
             'action_items': [
@@ -117,10 +134,10 @@ def create_sample_meetings():
         },
         
         {
-            'id': str(uuid.uuid4()),
+            'id': str(uuid.uuid5(_SAMPLE_MEETING_NAMESPACE, 'Sales Pipeline Review')),
             'title': 'Sales Pipeline Review',
             'date': '2024-11-25T11:00:00',
-            'transcript': '''
+            'transcript': _compact('''
             VP Sales Rachel: Let's review our Q4 sales pipeline and discuss closing strategies.
             
             Account Manager Tom: Enterprise Corp deal is at $280,000, ready to close this week.
@@ -136,7 +153,7 @@ def create_sample_meetings():
             Jessica: Should I approve the 10% discount for TechStart?
             
             Kevin: Global Solutions needs approval for extended payment terms.
-            ''',
+            '''),
             'participants': ['Rachel', 'Tom', 'Jessica', 'Kevin'],
             'summary': 'Sales pipeline review focusing on Q4 deals, closing strategies, contract negotiations, and revenue targets.',
             'action_items': [
@@ -158,37 +175,71 @@ def create_sample_meetings():
     
     return meetings
 
-def test_meeting_indexing(search_engine, sample_meetings):
+if pytest is not None:
+    @pytest.fixture(scope="session")
+    def sample_meetings():
+        """Sample meetings shared by every test in the session"""
+        return create_sample_meetings()
+    
+    @pytest.fixture(scope="session")
+    def search_engine(tmp_path_factory, sample_meetings):
+        """Engine with the sample meetings indexed once for all query tests"""
+        engine = MeetingSearchEngine(index_path=str(tmp_path_factory.mktemp("search_index")))
+        precomputed = None
+        if os.path.exists(SAMPLE_EMBEDDINGS_PATH) and os.path.exists(SAMPLE_DIGEST_PATH):
+            with open(SAMPLE_DIGEST_PATH) as f:
+                saved_digest = f.read().strip()
+            if saved_digest == engine.chunk_digest(sample_meetings):
+                import numpy as np
+                precomputed = np.load(SAMPLE_EMBEDDINGS_PATH, mmap_mode='r')  # Zero-copy, shared page cache across workers
+            else:
+                logger.warning("Sample embeddings fixture is stale; encoding the sample meetings instead")
+        engine.add_meetings(sample_meetings, precomputed_embeddings=precomputed)
+        return engine
+    
+    @pytest.fixture
+    def empty_search_engine(tmp_path):
+        """Fresh engine in a scratch directory; the sentence transformer is shared, not reloaded"""
+        return MeetingSearchEngine(index_path=str(tmp_path))
+
+def test_meeting_indexing(empty_search_engine, sample_meetings):
     """Test adding meetings to the search index"""
-    print("\n📚 TESTING: Meeting Indexing")
-    print("=" * 50)
+    logger.info("\n📚 TESTING: Meeting Indexing")
+    logger.info("=" * 50)
     
+    search_engine = empty_search_engine
     indexed_count = 0
     
-    for meeting in sample_meetings:
-        success = search_engine.add_meeting(meeting)
+    # Embed and index every sample meeting in one batch
+    results = search_engine.add_meetings(sample_meetings)
+    for meeting, success in zip(sample_meetings, results):
         if success:
             indexed_count += 1
-            print(f"✅ Indexed: {meeting['title']}")
+            logger.info("✅ Indexed: %s", meeting['title'])
         else:
-            print(f"❌ Failed to index: {meeting['title']}")
+            logger.error("❌ Failed to index: %s", meeting['title'])
     
     # Get updated statistics
     stats = search_engine.get_search_statistics()
-    
-    print(f"\n📊 INDEXING RESULTS:")
-    print(f"   Successfully indexed: {indexed_count}/{len(sample_meetings)} meetings")
-    print(f"   Total documents: {stats.get('total_documents', 0)}")
-    print(f"   Total meetings: {stats.get('total_meetings', 0)}")
-    print(f"   Content distribution: {stats.get('content_type_distribution', {})}")
-    print(f"   Index size: {stats.get('index_size_mb', 0):.2f} MB")
-    
-    return indexed_count > 0
+    expected_chunks = sum(
+        len(search_engine._extract_searchable_content(meeting)['texts']) for meeting in sample_meetings
+    )
+    
+    logger.info("\n📊 INDEXING RESULTS:")
+    logger.info("   Successfully indexed: %d/%d meetings", indexed_count, len(sample_meetings))
+    logger.info("   Total documents: %d", stats.get('total_documents', 0))
+    logger.info("   Total meetings: %d", stats.get('total_meetings', 0))
+    logger.info("   Content distribution: %s", stats.get('content_type_distribution', {}))
+    logger.info("   Index size: %.2f MB", stats.get('index_size_mb', 0))
+    
+    assert indexed_count == len(sample_meetings), f"Indexed {indexed_count}/{len(sample_meetings)} meetings"
+    assert stats.get('total_meetings') == len(sample_meetings)
+    assert stats.get('total_documents') == expected_chunks == search_engine.index.ntotal
 
 def test_search_functionality(search_engine):
     """Test various search queries"""
-    print("\n🔍 TESTING: Search Functionality")
-    print("=" * 50)
+    logger.info("\n🔍 TESTING: Search Functionality")
+    logger.info("=" * 50)
     
     test_queries = [
         "budget planning and financial projections",
@@ -200,113 +251,119 @@ def test_search_functionality(search_engine):
     ]
     
     for query in test_queries:
-        print(f"\n🔎 Query: '{query}'")
+        logger.info("\n🔎 Query: '%s'", query)
         results = search_engine.search(query, top_k=3)
         
         if results:
-            print(f"   Found {len(results)} results:")
+            logger.info("   Found %d results:", len(results))
+            # Arguments are only formatted when a handler emits the record
             for i, result in enumerate(results, 1):
-                print(f"   {i}. [{result['meeting_title']}] ({result['content_type']})")
-                print(f"      Score: {result['relevance_score']:.3f}")
-                print(f"      Snippet: {result['snippet'][:100]}...")
+                logger.info("   %d. [%s] (%s)", i, result['meeting_title'], result['content_type'])
+                logger.info("      Score: %.3f", result['relevance_score'])
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("      Snippet: %s...", result['snippet'][:100])
         else:
-            print("   No results found")
+            logger.info("   No results found")
+        
+        assert results, f"No results for '{query}'"
+        assert len(results) <= 3
 
 def test_content_type_filtering(search_engine):
     """Test searching with content type filters"""
-    print("\n🎯 TESTING: Content Type Filtering")
-    print("=" * 50)
+    logger.info("\n🎯 TESTING: Content Type Filtering")
+    logger.info("=" * 50)
     
     query = "budget and financial"
     content_types = ['summary', 'action_item', 'decision', 'transcript']
     
+    # One FAISS search serves every content type
+    grouped_results = search_engine.search_by_content_types(query, content_types, top_k=3)
+    
     for content_type in content_types:
-        print(f"\n🔍 Searching for '{query}' in {content_type}:")
-        results = search_engine.search(query, top_k=3, content_types=[content_type])
+        logger.info("\n🔍 Searching for '%s' in %s:", query, content_type)
+        results = grouped_results[content_type]
         
         if results:
             for i, result in enumerate(results, 1):
-                print(f"   {i}. [{result['meeting_title']}] - {result['content_type']}")
-                print(f"      Score: {result['relevance_score']:.3f}")
+                logger.info("   %d. [%s] - %s", i, result['meeting_title'], result['content_type'])
+                logger.info("      Score: %.3f", result['relevance_score'])
         else:
-            print(f"   No {content_type} results found")
+            logger.info("   No %s results found", content_type)
+        
+        assert all(result['content_type'] == content_type for result in results), \
+            f"{content_type} results carry other content types: {[r['content_type'] for r in results]}"
+    
+    assert any(grouped_results.values()), f"No results for '{query}' in any content type"
 
 def test_similar_meetings(search_engine, sample_meetings):
     """Test finding similar meetings"""
-    print("\n🔗 TESTING: Similar Meeting Discovery")
-    print("=" * 50)
+    logger.info("\n🔗 TESTING: Similar Meeting Discovery")
+    logger.info("=" * 50)
     
-    if not sample_meetings:
-        print("❌ No sample meetings available")
-        return
+    assert sample_meetings, "No sample meetings available"
     
     reference_meeting_id = sample_meetings[0]['id']
     reference_title = sample_meetings[0]['title']
     
-    print(f"🔎 Finding meetings similar to: '{reference_title}'")
+    logger.info("🔎 Finding meetings similar to: '%s'", reference_title)
     
     similar_meetings = search_engine.get_similar_meetings(reference_meeting_id, top_k=3)
     
     if similar_meetings:
-        print(f"   Found {len(similar_meetings)} similar meetings:")
+        logger.info("   Found %d similar meetings:", len(similar_meetings))
         for i, meeting in enumerate(similar_meetings, 1):
-            print(f"   {i}. {meeting['meeting_title']}")
-            print(f"      Similarity: {meeting['average_similarity']:.3f}")
-            print(f"      Matching content: {', '.join(meeting['matching_content_types'])}")
+            logger.info("   %d. %s", i, meeting['meeting_title'])
+            logger.info("      Similarity: %.3f", meeting['average_similarity'])
+            logger.info("      Matching content: %s", ', '.join(meeting['matching_content_types']))
     else:
-        print("   No similar meetings found")
+        logger.info("   No similar meetings found")
+    
+    assert similar_meetings, f"No meetings similar to '{reference_title}'"
+    assert all(meeting['meeting_id'] != reference_meeting_id for meeting in similar_meetings), \
+        "Reference meeting returned as similar to itself"
 
 def test_meeting_retrieval(search_engine, sample_meetings):
     """Test retrieving specific meeting content"""
-    print("\n📖 TESTING: Meeting Content Retrieval")
-    print("=" * 50)
+    logger.info("\n📖 TESTING: Meeting Content Retrieval")
+    logger.info("=" * 50)
     
-    if not sample_meetings:
-        print("❌ No sample meetings available")
-        return
+    assert sample_meetings, "No sample meetings available"
     
     meeting_id = sample_meetings[1]['id']  # Technical meeting
     meeting_title = sample_meetings[1]['title']
     
-    print(f"📄 Retrieving content for: '{meeting_title}'")
+    logger.info("📄 Retrieving content for: '%s'", meeting_title)
     
     content = search_engine.search_by_meeting_id(meeting_id)
     
     if content:
-        print(f"   Found {len(content)} content chunks:")
-        content_types = {}
-        for chunk in content:
-            content_type = chunk['content_type']
-            content_types[content_type] = content_types.get(content_type, 0) + 1
+        logger.info("   Found %d content chunks:", len(content))
+        content_types = Counter(chunk['content_type'] for chunk in content)
         
         for content_type, count in content_types.items():
-            print(f"   • {content_type}: {count} chunks")
+            logger.info("   • %s: %d chunks", content_type, count)
     else:
-        print("   No content found for meeting")
+        logger.info("   No content found for meeting")
+    
+    assert content, f"No content found for '{meeting_title}'"
+    assert all(chunk['meeting_title'] == meeting_title for chunk in content)
 
-def comprehensive_search_test():
-    """Run comprehensive search engine tests"""
-    print("🧪 COMPREHENSIVE SEARCH ENGINE TESTING")
-    print("=" * 80)
+def comprehensive_search_test(index_path: str):
+    """Run comprehensive search engine tests; the first failed assertion stops the run"""
+    logger.info("🧪 COMPREHENSIVE SEARCH ENGINE TESTING")
+    logger.info("=" * 80)
     
     # Initialize search engine
-    search_engine = test_search_engine_setup()
-    
-    if not search_engine:
-        print("❌ Cannot continue without search engine")
-        return
+    test_search_engine_setup(os.path.join(index_path, "setup"))
+    search_engine = MeetingSearchEngine(index_path=os.path.join(index_path, "main"))
     
     # Create sample data
-    print("\n📝 Creating sample meeting data...")
+    logger.info("\n📝 Creating sample meeting data...")
     sample_meetings = create_sample_meetings()
-    print(f"✅ Created {len(sample_meetings)} sample meetings")
+    logger.info("✅ Created %d sample meetings", len(sample_meetings))
     
     # Test indexing
-    indexing_success = test_meeting_indexing(search_engine, sample_meetings)
-    
-    if not indexing_success:
-        print("❌ Cannot continue without indexed meetings")
-        return
+    test_meeting_indexing(search_engine, sample_meetings)
     
     # Test search functionality
     test_search_functionality(search_engine)
@@ -320,17 +377,23 @@ def comprehensive_search_test():
     # Test meeting retrieval
     test_meeting_retrieval(search_engine, sample_meetings)
     
-    print("\n🏆 SEARCH ENGINE TESTING SUMMARY")
-    print("=" * 50)
+    logger.info("\n🏆 SEARCH ENGINE TESTING SUMMARY")
+    logger.info("=" * 50)
     
     final_stats = search_engine.get_search_statistics()
-    print(f"✅ Successfully tested search engine")
-    print(f"   Total documents indexed: {final_stats.get('total_documents', 0)}")
-    print(f"   Total meetings processed: {final_stats.get('total_meetings', 0)}")
-    print(f"   Search capabilities: ✅ Semantic search, ✅ Content filtering, ✅ Similar meetings")
-    print(f"   Performance: ✅ Fast indexing, ✅ Real-time search, ✅ Relevance scoring")
+    logger.info("✅ Successfully tested search engine")
+    logger.info("   Total documents indexed: %d", final_stats.get('total_documents', 0))
+    logger.info("   Total meetings processed: %d", final_stats.get('total_meetings', 0))
+    logger.info("   Search capabilities: ✅ Semantic search, ✅ Content filtering, ✅ Similar meetings")
+    logger.info("   Performance: ✅ Fast indexing, ✅ Real-time search, ✅ Relevance scoring")
     
-    print("\n🚀 SEARCH MODULE READY FOR INTEGRATION!")
+    logger.info("\n🚀 SEARCH MODULE READY FOR INTEGRATION!")
 
 if __name__ == "__main__":
-    comprehensive_search_test()
+    # Report through this module's logger only; library INFO records stay quiet
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    with tempfile.TemporaryDirectory(prefix="search_index_") as index_path:
+        comprehensive_search_test(index_path)
@@ -2,18 +2,18 @@
 
 import sys
 import os
+from itertools import islice
+from typing import TYPE_CHECKING
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from models.nlp import NLPProcessor
+from models import NO_DEADLINE, UNASSIGNED
+from shared_nlp import get_nlp
 
-def comprehensive_nlp_validation():
-    """Complete validation of all NLP improvements"""
-    
-    print("🎯 COMPREHENSIVE NLP SYSTEM VALIDATION")
-    print("=" * 80)
-    
-    # Test case that combines multiple challenging aspects
-    comprehensive_test = """
+if TYPE_CHECKING:
+    from models.nlp import NLPProcessor
+
+# Test case that combines multiple challenging aspects
+_COMPREHENSIVE_TEXT = """
     CEO Sarah Mitchell: Good morning everyone. We're facing some critical decisions about our Q4 strategy and need to move quickly.
     
     CTO Raj Patel: Sarah, I've completed the security audit. We have decided to implement multi-factor authentication across all systems by December 31st.
@@ -58,129 +58,136 @@ def comprehensive_nlp_validation():
     
     Maria: I'll collaborate with HR and have the curriculum ready by January 10th.
     """
+
+def comprehensive_nlp_validation(nlp: "NLPProcessor" = None, result: dict = None):
+    """Complete validation of all NLP improvements"""
+    
+    print("🎯 COMPREHENSIVE NLP SYSTEM VALIDATION")
+    print("=" * 80)
     
     print("🔬 ANALYZING COMPREHENSIVE TEST CASE...")
     print("=" * 50)
     
-    nlp = NLPProcessor()
-    result = nlp.generate_comprehensive_summary(comprehensive_test)
-    
-    # Detailed analysis
-    print("📊 COMPREHENSIVE ANALYSIS RESULTS:")
-    print(f"   📋 Summary Quality: {len(result['summary'].split())} words")
-    print(f"   ✅ Action Items: {len(result['action_items'])}")
-    print(f"   🎯 Key Decisions: {len(result['key_decisions'])}")
-    print(f"   ⏰ Timeline Items: {len(result['timelines'])}")
-    print(f"   👥 Participants: {len(result['participants'])}")
-    print(f"   🏷️ Topics: {len(result['topics'])}")
-    print()
-    
-    # Quality metrics
-    assigned_actions = sum(1 for item in result['action_items'] 
-                          if isinstance(item, dict) and item.get('assignee', 'Unassigned') != 'Unassigned')
-    
-    deadline_actions = sum(1 for item in result['action_items']
-                          if isinstance(item, dict) and item.get('deadline', 'No deadline') != 'No deadline')
-    
-    high_confidence_actions = sum(1 for item in result['action_items']
-                                 if isinstance(item, dict) and item.get('confidence', 0.0) >= 0.8)
-    
-    print("🎯 QUALITY METRICS:")
-    print(f"   Assignment Accuracy: {assigned_actions}/{len(result['action_items'])} ({assigned_actions/len(result['action_items'])*100:.1f}%)")
-    print(f"   Deadline Detection: {deadline_actions}/{len(result['action_items'])} ({deadline_actions/len(result['action_items'])*100:.1f}%)")
-    print(f"   High Confidence Items: {high_confidence_actions}/{len(result['action_items'])} ({high_confidence_actions/len(result['action_items'])*100:.1f}%)")
-    print()
-    
-    # Show top results
-    print("🏆 TOP ACTION ITEMS (with full details):")
-    for i, item in enumerate(result['action_items'][:5], 1):
+    if result is None:
+        result = (nlp or get_nlp()).generate_comprehensive_summary(_COMPREHENSIVE_TEXT)
+    
+    # Quality metrics, counted in a single pass over the action items
+    assigned_actions = deadline_actions = high_confidence_actions = 0
+    for item in result['action_items']:
+        if isinstance(item, dict):
+            assigned_actions += item.get('assignee', UNASSIGNED) != UNASSIGNED
+            deadline_actions += item.get('deadline', NO_DEADLINE) != NO_DEADLINE
+            high_confidence_actions += item.get('confidence', 0.0) >= 0.8
+    
+    # Rates computed once; an empty result reports 0% instead of dividing by zero
+    action_count = len(result['action_items'])
+    assignment_rate = assigned_actions / (action_count or 1)
+    deadline_rate = deadline_actions / (action_count or 1)
+    confidence_rate = high_confidence_actions / (action_count or 1)
+    
+    # Detailed analysis, collected and written in one call
+    lines = [
+        "📊 COMPREHENSIVE ANALYSIS RESULTS:",
+        f"   📋 Summary Quality: {len(result['summary'].split())} words",
+        f"   ✅ Action Items: {action_count}",
+        f"   🎯 Key Decisions: {len(result['key_decisions'])}",
+        f"   ⏰ Timeline Items: {len(result['timelines'])}",
+        f"   👥 Participants: {len(result['participants'])}",
+        f"   🏷️ Topics: {len(result['topics'])}",
+        "",
+        "🎯 QUALITY METRICS:",
+        f"   Assignment Accuracy: {assigned_actions}/{action_count} ({assignment_rate*100:.1f}%)",
+        f"   Deadline Detection: {deadline_actions}/{action_count} ({deadline_rate*100:.1f}%)",
+        f"   High Confidence Items: {high_confidence_actions}/{action_count} ({confidence_rate*100:.1f}%)",
+        "",
+        "🏆 TOP ACTION ITEMS (with full details):",
+    ]
+    for i, item in enumerate(islice(result['action_items'], 5), 1):
         if isinstance(item, dict):
-            assignee = item.get('assignee', 'Unassigned')
+            assignee = item.get('assignee', UNASSIGNED)
             text = item.get('text', '')
-            deadline = item.get('deadline', 'No deadline')
+            deadline = item.get('deadline', NO_DEADLINE)
             confidence = item.get('confidence', 0.0)
             category = item.get('category', 'General')
             
-            print(f"   {i}. [{assignee}] {text[:100]}...")
-            if deadline != 'No deadline':
-                print(f"      ⏰ Due: {deadline}")
-            print(f"      📂 Category: {category}")
-            print(f"      🎯 Confidence: {confidence:.2f}")
-        print()
-    
-    print("🎯 KEY DECISIONS EXTRACTED:")
-    for i, decision in enumerate(result['key_decisions'][:5], 1):
-        print(f"   {i}. {decision[:120]}...")
-    print()
-    
-    print("⏰ TIMELINE ANALYSIS:")
-    for i, timeline in enumerate(result['timelines'][:5], 1):
+            lines.append(f"   {i}. [{assignee}] {text[:100]}...")
+            if deadline != NO_DEADLINE:
+                lines.append(f"      ⏰ Due: {deadline}")
+            lines.append(f"      📂 Category: {category}")
+            lines.append(f"      🎯 Confidence: {confidence:.2f}")
+        lines.append("")
+    
+    lines.append("🎯 KEY DECISIONS EXTRACTED:")
+    lines += [f"   {i}. {decision[:120]}..." for i, decision in enumerate(islice(result['key_decisions'], 5), 1)]
+    lines.append("")
+    
+    lines.append("⏰ TIMELINE ANALYSIS:")
+    for i, timeline in enumerate(islice(result['timelines'], 5), 1):
         if isinstance(timeline, dict):
-            print(f"   {i}. {timeline.get('timeline', timeline)} ({timeline.get('type', 'general')})")
+            lines.append(f"   {i}. {timeline.get('timeline', timeline)} ({timeline.get('type', 'general')})")
         else:
-            print(f"   {i}. {timeline}")
-    print()
+            lines.append(f"   {i}. {timeline}")
+    lines.append("")
     
-    print("👥 EXECUTIVE TEAM IDENTIFIED:")
-    for participant in result['participants']:
-        print(f"   • {participant}")
-    print()
+    lines.append("👥 EXECUTIVE TEAM IDENTIFIED:")
+    lines += [f"   • {participant}" for participant in result['participants']]
+    lines.append("")
+    print("\n".join(lines))
     
     return result, {
-        'assignment_rate': assigned_actions/len(result['action_items']) if result['action_items'] else 0,
-        'deadline_rate': deadline_actions/len(result['action_items']) if result['action_items'] else 0,
-        'confidence_rate': high_confidence_actions/len(result['action_items']) if result['action_items'] else 0
+        'assignment_rate': assignment_rate,
+        'deadline_rate': deadline_rate,
+        'confidence_rate': confidence_rate
     }
 
-def final_performance_summary():
-    """Provide final performance summary of all improvements"""
-    
-    result, metrics = comprehensive_nlp_validation()
-    
-    print("\n🏆 FINAL NLP SYSTEM PERFORMANCE REPORT")
-    print("=" * 80)
-    
-    print("✅ IMPROVEMENT ACHIEVEMENTS:")
-    print("   🔹 Enhanced Action Item Extraction with Pattern Matching")
-    print("   🔹 Improved Participant Detection with False Positive Filtering")
-    print("   🔹 Advanced Decision Recognition with Multiple Patterns")
-    print("   🔹 Sophisticated Timeline Extraction with Type Classification")
-    print("   🔹 Better Deadline Parsing with Natural Language Processing")
-    print("   🔹 Confidence Scoring for All Extracted Items")
-    print("   🔹 Comprehensive Structured Output Format")
-    print()
-    
-    print("📊 PERFORMANCE BENCHMARKS:")
-    print(f"   📈 Assignment Accuracy: {metrics['assignment_rate']*100:.1f}%")
-    print(f"   📅 Deadline Detection: {metrics['deadline_rate']*100:.1f}%")
-    print(f"   🎯 High Confidence Rate: {metrics['confidence_rate']*100:.1f}%")
-    print()
-    
-    print("🧪 TESTING COVERAGE:")
-    print("   ✅ Real-world Board Meetings")
-    print("   ✅ Crisis Management Scenarios")
-    print("   ✅ Technical Architecture Discussions")
-    print("   ✅ Sales Pipeline Reviews")
-    print("   ✅ Ambiguous Language Handling")
-    print("   ✅ Interruption & Crosstalk Scenarios")
-    print("   ✅ Multilingual Names & Terms")
-    print()
-    
-    print("🚀 SYSTEM CAPABILITIES:")
-    print("   ⚡ Processes complex executive meetings with 95%+ accuracy")
-    print("   🎯 Extracts action items with assignees and deadlines")
-    print("   🔍 Identifies key decisions from ambiguous discussions") 
-    print("   ⏰ Parses timelines and project schedules accurately")
-    print("   👥 Handles diverse international team members")
-    print("   💪 Robust performance in chaotic meeting scenarios")
-    print()
-    
-    print("🎉 NLP SYSTEM VALIDATED SUCCESSFULLY!")
-    print("   The Polyglot Meeting Assistant NLP module is now:")
-    print("   • Thoroughly tested with real-world scenarios")
-    print("   • Enhanced with advanced pattern matching")
-    print("   • Optimized for meeting analysis accuracy")
-    print("   • Ready for integration with ASR and Search modules")
+def final_performance_summary(result: dict = None):
+    """Provide final performance summary of all improvements, reusing an existing analysis when one is passed in"""
+    
+    result, metrics = comprehensive_nlp_validation(result=result)
+    
+    # Build the whole report first and write it in one call
+    lines = [
+        "\n🏆 FINAL NLP SYSTEM PERFORMANCE REPORT",
+        "=" * 80,
+        "✅ IMPROVEMENT ACHIEVEMENTS:",
+        "   🔹 Enhanced Action Item Extraction with Pattern Matching",
+        "   🔹 Improved Participant Detection with False Positive Filtering",
+        "   🔹 Advanced Decision Recognition with Multiple Patterns",
+        "   🔹 Sophisticated Timeline Extraction with Type Classification",
+        "   🔹 Better Deadline Parsing with Natural Language Processing",
+        "   🔹 Confidence Scoring for All Extracted Items",
+        "   🔹 Comprehensive Structured Output Format",
+        "",
+        "📊 PERFORMANCE BENCHMARKS:",
+        f"   📈 Assignment Accuracy: {metrics['assignment_rate']*100:.1f}%",
+        f"   📅 Deadline Detection: {metrics['deadline_rate']*100:.1f}%",
+        f"   🎯 High Confidence Rate: {metrics['confidence_rate']*100:.1f}%",
+        "",
+        "🧪 TESTING COVERAGE:",
+        "   ✅ Real-world Board Meetings",
+        "   ✅ Crisis Management Scenarios",
+        "   ✅ Technical Architecture Discussions",
+        "   ✅ Sales Pipeline Reviews",
+        "   ✅ Ambiguous Language Handling",
+        "   ✅ Interruption & Crosstalk Scenarios",
+        "   ✅ Multilingual Names & Terms",
+        "",
+        "🚀 SYSTEM CAPABILITIES:",
+        "   ⚡ Processes complex executive meetings with 95%+ accuracy",
+        "   🎯 Extracts action items with assignees and deadlines",
+        "   🔍 Identifies key decisions from ambiguous discussions",
+        "   ⏰ Parses timelines and project schedules accurately",
+        "   👥 Handles diverse international team members",
+        "   💪 Robust performance in chaotic meeting scenarios",
+        "",
+        "🎉 NLP SYSTEM VALIDATED SUCCESSFULLY!",
+        "   The Polyglot Meeting Assistant NLP module is now:",
+        "   • Thoroughly tested with real-world scenarios",
+        "   • Enhanced with advanced pattern matching",
+        "   • Optimized for meeting analysis accuracy",
+        "   • Ready for integration with ASR and Search modules",
+    ]
+    print("\n".join(lines))
 
 if __name__ == "__main__":
     final_performance_summary()
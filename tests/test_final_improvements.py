@@ -2,18 +2,17 @@
 
 import sys
 import os
+from typing import TYPE_CHECKING
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from models.nlp import NLPProcessor
+from models import NO_DEADLINE, UNASSIGNED
+from shared_nlp import get_nlp
 
-def test_improvements_comparison():
-    """Compare the improvements made to NLP analysis"""
-    
-    print("🎯 NLP IMPROVEMENT ANALYSIS")
-    print("=" * 60)
-    
-    # Test case with clear action items and decisions
-    comprehensive_meeting = """
+if TYPE_CHECKING:
+    from models.nlp import NLPProcessor
+
+# Test case with clear action items and decisions
+_COMPREHENSIVE_TEXT = """
     Meeting Leader Sarah: Good morning team. We need to finalize our Q4 strategy today.
     
     Product Manager Mike: I've reviewed all the proposals. We have decided to prioritize the mobile app redesign.
@@ -44,85 +43,93 @@ def test_improvements_comparison():
     
     Sarah: I'll have my recommendations ready by Thursday.
     """
+
+def test_improvements_comparison(nlp: "NLPProcessor" = None, result: dict = None):
+    """Compare the improvements made to NLP analysis"""
     
-    nlp = NLPProcessor()
-    result = nlp.generate_comprehensive_summary(comprehensive_meeting)
-    
-    # Analysis of improvements
-    print("📊 IMPROVEMENT METRICS:")
-    print(f"   Action Items Detected: {len(result['action_items'])}")
-    print(f"   Key Decisions Found: {len(result['key_decisions'])}")  
-    print(f"   Timeline Items: {len(result['timelines'])}")
-    print(f"   Participants Identified: {len(result['participants'])}")
-    print()
+    print("🎯 NLP IMPROVEMENT ANALYSIS")
+    print("=" * 60)
     
-    print("✅ ENHANCED ACTION ITEMS (with assignees & deadlines):")
+    if result is None:
+        result = (nlp or get_nlp()).generate_comprehensive_summary(_COMPREHENSIVE_TEXT)
+    
+    # Analysis of improvements, collected and written in one call
+    lines = [
+        "📊 IMPROVEMENT METRICS:",
+        f"   Action Items Detected: {len(result['action_items'])}",
+        f"   Key Decisions Found: {len(result['key_decisions'])}",
+        f"   Timeline Items: {len(result['timelines'])}",
+        f"   Participants Identified: {len(result['participants'])}",
+        "",
+        "✅ ENHANCED ACTION ITEMS (with assignees & deadlines):",
+    ]
     for i, item in enumerate(result['action_items'], 1):
         if isinstance(item, dict):
-            assignee = item.get('assignee', 'Unassigned')
-            deadline = item.get('deadline', 'No deadline')
+            assignee = item.get('assignee', UNASSIGNED)
+            deadline = item.get('deadline', NO_DEADLINE)
             confidence = item.get('confidence', 0.0)
-            print(f"   {i}. [{assignee}] {item.get('text', '')[:80]}...")
-            if deadline != 'No deadline':
-                print(f"      ⏰ Due: {deadline}")
-            print(f"      🎯 Confidence: {confidence:.1f}")
-        print()
-    
-    print("🎯 IMPROVED DECISION DETECTION:")
-    for i, decision in enumerate(result['key_decisions'], 1):
-        print(f"   {i}. {decision[:100]}...")
-    print()
-    
-    print("⏰ ENHANCED TIMELINE EXTRACTION:")
+            lines.append(f"   {i}. [{assignee}] {item.get('text', '')[:80]}...")
+            if deadline != NO_DEADLINE:
+                lines.append(f"      ⏰ Due: {deadline}")
+            lines.append(f"      🎯 Confidence: {confidence:.1f}")
+        lines.append("")
+    
+    lines.append("🎯 IMPROVED DECISION DETECTION:")
+    lines += [f"   {i}. {decision[:100]}..." for i, decision in enumerate(result['key_decisions'], 1)]
+    lines.append("")
+    
+    lines.append("⏰ ENHANCED TIMELINE EXTRACTION:")
     for i, timeline in enumerate(result['timelines'], 1):
         if isinstance(timeline, dict):
             timeline_text = timeline.get('timeline', '')
             timeline_type = timeline.get('type', 'general')
             confidence = timeline.get('confidence', 0.0)
-            print(f"   {i}. {timeline_text} ({timeline_type}) - Confidence: {confidence:.1f}")
+            lines.append(f"   {i}. {timeline_text} ({timeline_type}) - Confidence: {confidence:.1f}")
         else:
-            print(f"   {i}. {timeline}")
-    print()
+            lines.append(f"   {i}. {timeline}")
+    lines.append("")
     
-    print("👥 PARTICIPANT EXTRACTION:")
+    lines.append("👥 PARTICIPANT EXTRACTION:")
     participants = result['participants']
     if participants:
-        for i, participant in enumerate(participants, 1):
-            print(f"   {i}. {participant}")
+        lines += [f"   {i}. {participant}" for i, participant in enumerate(participants, 1)]
     else:
-        print("   No participants detected")
-    print()
-    
-    print("🏆 IMPROVEMENT HIGHLIGHTS:")
-    print("   ✅ Enhanced action item extraction with pattern matching")
-    print("   ✅ Better assignee detection and deadline parsing") 
-    print("   ✅ Improved decision recognition with multiple patterns")
-    print("   ✅ Advanced timeline extraction with type classification")
-    print("   ✅ Refined participant identification with filtering")
-    print("   ✅ Comprehensive structured output with confidence scores")
-    
-    print("\n" + "=" * 60)
+        lines.append("   No participants detected")
+    lines += [
+        "",
+        "🏆 IMPROVEMENT HIGHLIGHTS:",
+        "   ✅ Enhanced action item extraction with pattern matching",
+        "   ✅ Better assignee detection and deadline parsing",
+        "   ✅ Improved decision recognition with multiple patterns",
+        "   ✅ Advanced timeline extraction with type classification",
+        "   ✅ Refined participant identification with filtering",
+        "   ✅ Comprehensive structured output with confidence scores",
+        "\n" + "=" * 60,
+    ]
+    print("\n".join(lines))
     return result
 
-def analyze_accuracy():
-    """Analyze the accuracy of extraction"""
+def analyze_accuracy(result: dict = None):
+    """Analyze the accuracy of extraction, reusing an existing analysis when one is passed in"""
     print("\n🔍 ACCURACY ANALYSIS")
     print("=" * 40)
     
-    result = test_improvements_comparison()
-    
-    # Count different types of extractions
-    action_items_with_assignees = sum(1 for item in result['action_items'] 
-                                    if isinstance(item, dict) and item.get('assignee', 'Unassigned') != 'Unassigned')
+    result = test_improvements_comparison(result=result)
     
-    action_items_with_deadlines = sum(1 for item in result['action_items']
-                                    if isinstance(item, dict) and item.get('deadline', 'No deadline') != 'No deadline')
-    
-    print(f"📈 EXTRACTION ACCURACY:")
-    print(f"   Action items with assignees: {action_items_with_assignees}/{len(result['action_items'])}")
-    print(f"   Action items with deadlines: {action_items_with_deadlines}/{len(result['action_items'])}")
-    print(f"   Decision detection rate: {len(result['key_decisions'])} decisions found")
-    print(f"   Timeline extraction: {len(result['timelines'])} timeline items")
+    # Count different types of extractions in a single pass
+    action_items_with_assignees = action_items_with_deadlines = 0
+    for item in result['action_items']:
+        if isinstance(item, dict):
+            action_items_with_assignees += item.get('assignee', UNASSIGNED) != UNASSIGNED
+            action_items_with_deadlines += item.get('deadline', NO_DEADLINE) != NO_DEADLINE
+    
+    print("\n".join([
+        "📈 EXTRACTION ACCURACY:",
+        f"   Action items with assignees: {action_items_with_assignees}/{len(result['action_items'])}",
+        f"   Action items with deadlines: {action_items_with_deadlines}/{len(result['action_items'])}",
+        f"   Decision detection rate: {len(result['key_decisions'])} decisions found",
+        f"   Timeline extraction: {len(result['timelines'])} timeline items",
+    ]))
 
 if __name__ == "__main__":
     analyze_accuracy()